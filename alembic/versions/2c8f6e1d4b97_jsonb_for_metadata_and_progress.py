@@ -0,0 +1,59 @@
+"""jsonb for metadata and progress
+
+Revision ID: 2c8f6e1d4b97
+Revises: 9e5d3a8b6c21
+Create Date: 2026-10-15 12:40:05.318270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c8f6e1d4b97'
+down_revision: Union[str, Sequence[str], None] = '9e5d3a8b6c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'documents',
+        'metadata',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='metadata::jsonb',
+    )
+    op.alter_column(
+        'ingestion_jobs',
+        'progress',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='progress::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'ingestion_jobs',
+        'progress',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='progress::json',
+    )
+    op.alter_column(
+        'documents',
+        'metadata',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='metadata::json',
+    )
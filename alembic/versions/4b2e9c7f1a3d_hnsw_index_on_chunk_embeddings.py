@@ -0,0 +1,36 @@
+"""hnsw index on chunk embeddings
+
+Revision ID: 4b2e9c7f1a3d
+Revises: 8d097a61d75c
+Create Date: 2026-10-15 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b2e9c7f1a3d'
+down_revision: Union[str, Sequence[str], None] = '8d097a61d75c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_chunks_embedding_hnsw',
+        'chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chunks_embedding_hnsw', table_name='chunks')
@@ -0,0 +1,40 @@
+"""require pgvector 0.8 for iterative index scans
+
+Revision ID: 5f0a7d2c9e14
+Revises: 2c8f6e1d4b97
+Create Date: 2026-10-15 15:20:11.482906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0a7d2c9e14'
+down_revision: Union[str, Sequence[str], None] = '2c8f6e1d4b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MIN_PGVECTOR = (0, 8, 0)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Chunk search sets hnsw.iterative_scan, which pgvector only knows from 0.8
+    op.execute("ALTER EXTENSION vector UPDATE")
+    version = op.get_bind().scalar(
+        sa.text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    )
+    if tuple(int(part) for part in version.split(".")) < MIN_PGVECTOR:
+        raise RuntimeError(
+            f"pgvector {version} is installed; >= 0.8.0 is required "
+            "(e.g. image pgvector/pgvector:0.8.0-pg16)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Extension versions are not rolled back
+    pass
@@ -0,0 +1,60 @@
+"""halfvec embedding for ann search
+
+Revision ID: 9e5d3a8b6c21
+Revises: 4b2e9c7f1a3d
+Create Date: 2026-10-15 11:03:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e5d3a8b6c21'
+down_revision: Union[str, Sequence[str], None] = '4b2e9c7f1a3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: existing rows are backfilled by the ALTER and
+    # new rows are filled by Postgres, so inserts keep writing only `embedding`.
+    op.add_column(
+        'chunks',
+        sa.Column(
+            'embedding_h',
+            HALFVEC(384),
+            sa.Computed('embedding::halfvec(384)', persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'ix_chunks_embedding_h_hnsw',
+        'chunks',
+        ['embedding_h'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding_h': 'halfvec_cosine_ops'},
+    )
+    # ANN now runs on embedding_h; the float32 column is only read for re-ranking
+    op.drop_index('ix_chunks_embedding_hnsw', table_name='chunks')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_chunks_embedding_hnsw',
+        'chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+    op.drop_index('ix_chunks_embedding_h_hnsw', table_name='chunks')
+    op.drop_column('chunks', 'embedding_h')
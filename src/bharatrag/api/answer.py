@@ -1,88 +1,271 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
 
-from fastapi import APIRouter
+import numpy as np
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from bharatrag.api.deps import (
+    get_answer_cache,
+    get_llm,
+    get_llm_batcher,
+    get_retriever,
+)
+from bharatrag.api.responses import ModelJSONResponse
 from bharatrag.domain.answer import AnswerRequest, AnswerResponse, Citation
+from bharatrag.ports.llm import LLM
+from bharatrag.services.llm.batcher import LLMBatcher
+from bharatrag.services.llm.prompt import build_rag_prompt
 from bharatrag.services.retrieval_service import RetrievalService
-from bharatrag.services.llm.extractive_llm import ExtractiveLLM
+from bharatrag.services.semantic_cache import SemanticCache
+from bharatrag.core.config import get_settings
 from bharatrag.core.context import set_collection_id
+from bharatrag.core.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/answer", tags=["rag"])
-retriever = RetrievalService()
-llm = ExtractiveLLM()
+settings = get_settings()
 
 
-@router.post("", response_model=AnswerResponse)
-def answer(payload: AnswerRequest) -> AnswerResponse:
-    set_collection_id(payload.collection_id)
-    logger.info(
-        "Answer request received",
-        extra={
-            "collection_id": str(payload.collection_id),
-            "question_length": len(payload.question),
-            "top_k": payload.top_k,
-        },
+@dataclass(slots=True)
+class _RagContext:
+    """Everything retrieval produced for one question, ready for generation."""
+    q_vec: np.ndarray
+    cache_ns: tuple
+    # Cache generation of the collection before retrieval; the answer is only
+    # cached if no ingest invalidated the collection in the meantime
+    cache_generation: int = 0
+    cached: AnswerResponse | None = None
+    prompt: str = ""
+    context: list[str] = field(default_factory=list)
+    citations: list[Citation] = field(default_factory=list)
+
+
+async def _prepare(
+    payload: AnswerRequest,
+    cid: str,
+    retriever: RetrievalService,
+    cache: SemanticCache,
+) -> _RagContext:
+    q_vec = (await run_blocking(retriever.embedder.embed, [payload.question]))[0]
+    cache_ns = (payload.collection_id, payload.top_k)
+    rag = _RagContext(q_vec=q_vec, cache_ns=cache_ns, cache_generation=cache.generation(cache_ns))
+
+    if settings.semantic_cache_enabled:
+        rag.cached = cache.get(rag.cache_ns, q_vec)
+        if rag.cached is not None:
+            logger.info("Answer served from semantic cache", extra={"collection_id": cid})
+            return rag
+
+    results = await run_blocking(
+        retriever.query,
+        collection_id=payload.collection_id,
+        query=payload.question,
+        top_k=payload.top_k,
+        query_embedding=q_vec,
     )
-    
-    try:
-        results = retriever.query(
-            collection_id=payload.collection_id,
-            query=payload.question,
-            top_k=payload.top_k,
-        )
-        
+
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "Retrieved chunks for answer",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "chunk_count": len(results),
             },
         )
-        
-        # Extract context text and citations
-        context = [r.chunk.text for r in results]
-        citations = [
-            Citation(
-                document_id=r.chunk.document_id,
-                chunk_id=r.chunk.id,
-                chunk_index=r.chunk.chunk_index,
-            )
-            for r in results
-        ]
 
-        prompt = (
-            "You are Bharat-RAG (Weekend-3). Answer using ONLY the CONTEXT.\n\n"
-            f"QUESTION:\n{payload.question}\n\n"
-            "CONTEXT:\n" + "\n---\n".join(context)
+    # Extract context text and citations in a single pass. Chunk fields are
+    # already validated, so citations skip re-validation via model_construct.
+    for r in results:
+        chunk = r.chunk
+        rag.context.append(chunk.text)
+        rag.citations.append(
+            Citation.model_construct(
+                document_id=chunk.document_id,
+                chunk_id=chunk.id,
+                chunk_index=chunk.chunk_index,
+            )
         )
-        
+
+    rag.prompt = build_rag_prompt(payload.question, rag.context)
+
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "Generating answer with LLM",
             extra={
-                "collection_id": str(payload.collection_id),
-                "prompt_length": len(prompt),
-                "context_chunks": len(context),
+                "collection_id": cid,
+                "prompt_length": len(rag.prompt),
+                "context_chunks": len(rag.context),
             },
         )
-        
-        out = llm.generate(prompt)
-        
+    return rag
+
+
+def _sse(data: dict, event: str | None = None) -> str:
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _sse_done(response: AnswerResponse) -> str:
+    body = response.model_dump(mode="json", include={"citations", "context"})
+    return _sse(body, event="done")
+
+
+def _close_after(step: asyncio.Future, tokens: Iterator[str]) -> None:
+    """Done-callback closing `tokens` once the worker's next() has returned."""
+    if not step.cancelled():
+        # Mark it retrieved; the client is gone, so there is nobody to tell
+        step.exception()
+    tokens.close()
+
+
+async def _stream_answer(
+    llm: LLM,
+    rag: _RagContext,
+    cache: SemanticCache,
+    cid: str,
+) -> AsyncIterator[str]:
+    if rag.cached is not None:
+        yield _sse({"token": rag.cached.answer})
+        yield _sse_done(rag.cached)
+        return
+
+    tokens = llm.stream(rag.prompt)
+    parts: list[str] = []
+    step: asyncio.Future | None = None
+    try:
+        # Each step may run a decode, so pull tokens on the worker pool. The
+        # step is shielded: if the client leaves, the worker still finishes it
+        while True:
+            step = asyncio.ensure_future(run_blocking(next, tokens, None))
+            token = await asyncio.shield(step)
+            if token is None:
+                break
+            parts.append(token)
+            yield _sse({"token": token})
+    except Exception as e:
+        logger.exception(
+            "Answer streaming failed",
+            extra={"collection_id": cid, "error": str(e)},
+        )
+        yield _sse({"detail": "Answer generation failed"}, event="error")
+        return
+    finally:
+        # Releases the backend (e.g. the llama.cpp context) if the client left
+        # early. A generator can't be closed while a worker is inside its
+        # next(), so then it is closed as soon as that step returns
+        if step is None or step.done():
+            tokens.close()
+        else:
+            step.add_done_callback(lambda done: _close_after(done, tokens))
+
+    response = AnswerResponse.model_construct(
+        answer="".join(parts).strip(),
+        citations=rag.citations,
+        context=rag.context,
+    )
+    logger.info(
+        "Answer streamed successfully",
+        extra={
+            "collection_id": cid,
+            "answer_length": len(response.answer),
+            "citation_count": len(rag.citations),
+        },
+    )
+    if settings.semantic_cache_enabled:
+        cache.set(rag.cache_ns, rag.q_vec, response, generation=rag.cache_generation)
+    yield _sse_done(response)
+
+
+@router.post("", response_class=StreamingResponse)
+async def answer(
+    payload: AnswerRequest,
+    retriever: RetrievalService = Depends(get_retriever),
+    llm: LLM = Depends(get_llm),
+    cache: SemanticCache = Depends(get_answer_cache),
+) -> StreamingResponse:
+    """
+    Stream the answer as server-sent events: one `data: {"token": ...}` event per
+    generated piece, then `event: done` carrying citations and context.
+    """
+    cid = str(payload.collection_id)
+    set_collection_id(cid)
+    logger.info(
+        "Answer stream requested",
+        extra={
+            "collection_id": cid,
+            "question_length": len(payload.question),
+            "top_k": payload.top_k,
+        },
+    )
+
+    try:
+        rag = await _prepare(payload, cid, retriever, cache)
+    except Exception as e:
+        logger.exception(
+            "Answer generation failed",
+            extra={
+                "collection_id": cid,
+                "error": str(e),
+            },
+        )
+        raise
+
+    return StreamingResponse(
+        _stream_answer(llm, rag, cache, cid),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.post("/sync", response_model=AnswerResponse, response_class=ModelJSONResponse)
+async def answer_sync(
+    payload: AnswerRequest,
+    retriever: RetrievalService = Depends(get_retriever),
+    batcher: LLMBatcher = Depends(get_llm_batcher),
+    cache: SemanticCache = Depends(get_answer_cache),
+) -> ModelJSONResponse:
+    cid = str(payload.collection_id)
+    set_collection_id(cid)
+    logger.info(
+        "Answer request received",
+        extra={
+            "collection_id": cid,
+            "question_length": len(payload.question),
+            "top_k": payload.top_k,
+        },
+    )
+
+    try:
+        rag = await _prepare(payload, cid, retriever, cache)
+        if rag.cached is not None:
+            return ModelJSONResponse(rag.cached)
+
+        out = await batcher.submit(rag.prompt)
+
         logger.info(
             "Answer generated successfully",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "answer_length": len(out),
-                "citation_count": len(citations),
+                "citation_count": len(rag.citations),
             },
         )
-        
-        return AnswerResponse(answer=out, citations=citations, context=context)
+
+        response = AnswerResponse.model_construct(
+            answer=out, citations=rag.citations, context=rag.context
+        )
+        if settings.semantic_cache_enabled:
+            cache.set(rag.cache_ns, rag.q_vec, response, generation=rag.cache_generation)
+        return ModelJSONResponse(response)
     except Exception as e:
         logger.exception(
             "Answer generation failed",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "error": str(e),
             },
         )
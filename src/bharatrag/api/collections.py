@@ -3,6 +3,7 @@ import logging
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 
+from bharatrag.api.responses import ModelJSONResponse
 from bharatrag.domain.collection import CollectionCreate, Collection
 from bharatrag.services.repositories.collection_repository import CollectionRepository
 
@@ -12,8 +13,13 @@ router = APIRouter(prefix="/collections", tags=["collections"])
 repo = CollectionRepository()
 
 
-@router.post("", response_model=Collection, status_code=status.HTTP_201_CREATED)
-def create_collection(payload: CollectionCreate) -> Collection:
+@router.post(
+    "",
+    response_model=Collection,
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_collection(payload: CollectionCreate) -> ModelJSONResponse:
     logger.info("Collection creation requested", extra={"collection_name": payload.name})
     try:
         collection = repo.create(payload)
@@ -21,7 +27,7 @@ def create_collection(payload: CollectionCreate) -> Collection:
             "Collection created successfully",
             extra={"collection_id": str(collection.id), "collection_name": payload.name},
         )
-        return collection
+        return ModelJSONResponse(collection, status_code=status.HTTP_201_CREATED)
     except Exception as e:
         logger.exception(
             "Collection creation failed",
@@ -30,19 +36,20 @@ def create_collection(payload: CollectionCreate) -> Collection:
         raise
 
 
-@router.get("/{collection_id}", response_model=Collection)
-def get_collection(collection_id: UUID) -> Collection:
-    logger.debug("Collection fetch requested", extra={"collection_id": str(collection_id)})
+@router.get("/{collection_id}", response_model=Collection, response_class=ModelJSONResponse)
+def get_collection(collection_id: UUID) -> ModelJSONResponse:
+    cid = str(collection_id)
+    logger.debug("Collection fetch requested", extra={"collection_id": cid})
     result = repo.get(collection_id)
     if result is None:
-        logger.warning("Collection not found", extra={"collection_id": str(collection_id)})
+        logger.warning("Collection not found", extra={"collection_id": cid})
         raise HTTPException(status_code=404, detail="Collection not found")
-    logger.debug("Collection fetched successfully", extra={"collection_id": str(collection_id)})
-    return result
+    logger.debug("Collection fetched successfully", extra={"collection_id": cid})
+    return ModelJSONResponse(result)
 
 
-@router.get("", response_model=list[Collection])
-def list_collections(limit: int = 50, offset: int = 0) -> list[Collection]:
+@router.get("", response_model=list[Collection], response_class=ModelJSONResponse)
+def list_collections(limit: int = 50, offset: int = 0) -> ModelJSONResponse:
     logger.debug("List collections requested", extra={"limit": limit, "offset": offset})
     try:
         collections = repo.list(limit=limit, offset=offset)
@@ -50,7 +57,7 @@ def list_collections(limit: int = 50, offset: int = 0) -> list[Collection]:
             "Collections listed successfully",
             extra={"count": len(collections), "limit": limit, "offset": offset},
         )
-        return collections
+        return ModelJSONResponse(collections)
     except Exception as e:
         logger.exception("List collections failed", extra={"error": str(e)})
         raise
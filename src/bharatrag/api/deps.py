@@ -0,0 +1,55 @@
+"""
+Process-wide service instances shared by the API routers.
+
+Each getter builds its object on first use and returns the same instance
+afterwards, so a worker holds one retriever/LLM regardless of how many
+routers depend on it. `main.create_app` warms them up at startup.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from bharatrag.core.config import get_settings
+from bharatrag.ports.llm import LLM
+from bharatrag.services.llm.batcher import LLMBatcher
+from bharatrag.services.llm.llm_factory import create_llm
+from bharatrag.services.retrieval_service import RetrievalService
+from bharatrag.services.semantic_cache import SemanticCache
+
+
+@lru_cache(maxsize=1)
+def get_retriever() -> RetrievalService:
+    return RetrievalService()
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> LLM:
+    return create_llm()
+
+
+@lru_cache(maxsize=1)
+def get_llm_batcher() -> LLMBatcher:
+    settings = get_settings()
+    return LLMBatcher(
+        get_llm(),
+        max_batch_size=settings.llm_max_batch_size,
+        max_concurrency=settings.llm_workers,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_answer_cache() -> SemanticCache:
+    settings = get_settings()
+    return SemanticCache(
+        dim=get_retriever().embedder.dim,
+        threshold=settings.semantic_cache_threshold,
+        ttl_seconds=settings.semantic_cache_ttl_seconds,
+        max_entries=settings.semantic_cache_max_entries,
+    )
+
+
+def warmup() -> None:
+    """Build shared services and run one embedding so the first request is not cold."""
+    get_llm_batcher()
+    get_retriever().embedder.embed(["warmup"])
+    get_answer_cache()
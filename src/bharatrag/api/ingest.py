@@ -1,11 +1,15 @@
 import logging
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 from fastapi.exceptions import HTTPException
 
+from bharatrag.api.deps import get_answer_cache
+from bharatrag.api.responses import ModelJSONResponse
 from bharatrag.domain.ingestion_job import IngestionJobCreate, IngestionJob
 from bharatrag.services.ingestion_service import IngestionService
+from bharatrag.services.semantic_cache import SemanticCache
 from bharatrag.core.context import set_collection_id
+from bharatrag.core.executor import run_ingestion
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +17,22 @@ router = APIRouter(prefix="/ingestion-jobs", tags=["ingestion"])
 service = IngestionService()
 
 
-@router.post("", response_model=IngestionJob, status_code=status.HTTP_201_CREATED)
-def create_ingestion_job(payload: IngestionJobCreate) -> IngestionJob:
-    set_collection_id(payload.collection_id)
+@router.post(
+    "",
+    response_model=IngestionJob,
+    response_class=ModelJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_ingestion_job(
+    payload: IngestionJobCreate,
+    answer_cache: SemanticCache = Depends(get_answer_cache),
+) -> ModelJSONResponse:
+    cid = str(payload.collection_id)
+    set_collection_id(cid)
     logger.info(
         "Ingestion job creation requested",
         extra={
-            "collection_id": str(payload.collection_id),
+            "collection_id": cid,
             "source_type": payload.source_type,
             "format": payload.format,
             "uri_length": len(payload.uri) if payload.uri else 0,
@@ -27,21 +40,23 @@ def create_ingestion_job(payload: IngestionJobCreate) -> IngestionJob:
     )
     
     try:
-        job = service.ingest(payload)
+        job = await run_ingestion(service.ingest, payload)
+        # New chunks can change answers for this collection
+        answer_cache.invalidate(payload.collection_id)
         logger.info(
             "Ingestion job created successfully",
             extra={
                 "job_id": str(job.id),
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "status": job.status,
             },
         )
-        return job
+        return ModelJSONResponse(job, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
         logger.warning(
             "Ingestion job creation failed: validation error",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "error": str(e),
             },
         )
@@ -50,7 +65,7 @@ def create_ingestion_job(payload: IngestionJobCreate) -> IngestionJob:
         logger.exception(
             "Ingestion job creation failed: unexpected error",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "error": str(e),
             },
         )
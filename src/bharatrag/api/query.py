@@ -1,30 +1,37 @@
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from bharatrag.api.deps import get_retriever
+from bharatrag.api.responses import ModelJSONResponse
 from bharatrag.domain.query import QueryRequest, QueryResponse
 from bharatrag.services.retrieval_service import RetrievalService
 from bharatrag.core.context import set_collection_id
+from bharatrag.core.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/query", tags=["rag"])
-svc = RetrievalService()
 
 
-@router.post("", response_model=QueryResponse)
-def query(payload: QueryRequest) -> QueryResponse:
-    set_collection_id(payload.collection_id)
+@router.post("", response_model=QueryResponse, response_class=ModelJSONResponse)
+async def query(
+    payload: QueryRequest,
+    svc: RetrievalService = Depends(get_retriever),
+) -> ModelJSONResponse:
+    cid = str(payload.collection_id)
+    set_collection_id(cid)
     logger.info(
         "Query request received",
         extra={
-            "collection_id": str(payload.collection_id),
+            "collection_id": cid,
             "query_length": len(payload.query),
             "top_k": payload.top_k,
         },
     )
     
     try:
-        results = svc.query(
+        results = await run_blocking(
+            svc.query,
             collection_id=payload.collection_id,
             query=payload.query,
             top_k=payload.top_k,
@@ -32,16 +39,19 @@ def query(payload: QueryRequest) -> QueryResponse:
         logger.info(
             "Query completed successfully",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "result_count": len(results),
             },
         )
-        return QueryResponse(results=results, debug={"top_k": payload.top_k})
+        # Results come from the repository already typed; encode them as-is
+        return ModelJSONResponse(
+            QueryResponse.model_construct(results=results, debug={"top_k": payload.top_k})
+        )
     except Exception as e:
         logger.exception(
             "Query failed",
             extra={
-                "collection_id": str(payload.collection_id),
+                "collection_id": cid,
                 "error": str(e),
             },
         )
@@ -0,0 +1,57 @@
+"""
+JSON response classes.
+
+`/answer` and `/query` return every retrieved chunk's text, so response
+encoding is a real share of per-request CPU.
+
+`FastJSONResponse` is the app-wide default for plain content: when `orjson`
+is installed it is used for the final dump (C-level string escaping, native
+UUID/datetime support); otherwise this falls back to the stdlib encoder
+Starlette uses.
+
+`ModelJSONResponse` is for handlers that already hold their response
+model(s). It encodes a model, or a list of models, straight to bytes with
+pydantic-core's compiled serializer, so FastAPI's response path
+(re-validating the return value against `response_model`, dumping it to a
+dict, then JSON-encoding the dict) is skipped entirely. Routes keep
+`response_model` for the OpenAPI schema; since the handler returns a
+`Response`, a non-200 `status_code` must be passed to it explicitly.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+class ModelJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel | list[BaseModel]) -> bytes:
+        # by_alias matches FastAPI's own response_model serialization
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        if not content:
+            return b"[]"
+        return _list_adapter(type(content[0])).dump_json(content, by_alias=True)
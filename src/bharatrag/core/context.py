@@ -1,5 +1,9 @@
 """
 Request context management for tracking request_id, job_id, etc. across async operations.
+
+Ids are stored as given (usually `UUID`) and only formatted when a log record
+actually reads them; the formatted string is memoized on the stored value, so
+a request pays for at most one `UUID.__str__` per id however much it logs.
 """
 from __future__ import annotations
 
@@ -7,49 +11,69 @@ import contextvars
 from typing import Optional
 from uuid import UUID
 
+
+class _LazyId:
+    """Context value that formats its id on first `str()` and keeps the result."""
+
+    __slots__ = ("value", "_text")
+
+    def __init__(self, value: str | UUID):
+        self.value = value
+        self._text = value if isinstance(value, str) else None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = str(self.value)
+        return self._text
+
+
 # Context variables for request-scoped data
-_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
-_job_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("job_id", default=None)
-_collection_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("collection_id", default=None)
-_document_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("document_id", default=None)
+_request_id: contextvars.ContextVar[Optional[_LazyId]] = contextvars.ContextVar("request_id", default=None)
+_job_id: contextvars.ContextVar[Optional[_LazyId]] = contextvars.ContextVar("job_id", default=None)
+_collection_id: contextvars.ContextVar[Optional[_LazyId]] = contextvars.ContextVar("collection_id", default=None)
+_document_id: contextvars.ContextVar[Optional[_LazyId]] = contextvars.ContextVar("document_id", default=None)
+
+
+def _get_str(var: contextvars.ContextVar[Optional[_LazyId]]) -> Optional[str]:
+    current = var.get()
+    return None if current is None else str(current)
 
 
 def get_request_id() -> Optional[str]:
     """Get the current request ID from context."""
-    return _request_id.get()
+    return _get_str(_request_id)
 
 
-def set_request_id(request_id: str) -> None:
+def set_request_id(request_id: str | UUID) -> None:
     """Set the request ID in context."""
-    _request_id.set(request_id)
+    _request_id.set(_LazyId(request_id))
 
 
 def get_job_id() -> Optional[str]:
     """Get the current job ID from context."""
-    return _job_id.get()
+    return _get_str(_job_id)
 
 
 def set_job_id(job_id: str | UUID) -> None:
     """Set the job ID in context."""
-    _job_id.set(str(job_id))
+    _job_id.set(_LazyId(job_id))
 
 
 def get_collection_id() -> Optional[str]:
     """Get the current collection ID from context."""
-    return _collection_id.get()
+    return _get_str(_collection_id)
 
 
 def set_collection_id(collection_id: str | UUID) -> None:
     """Set the collection ID in context."""
-    _collection_id.set(str(collection_id))
+    _collection_id.set(_LazyId(collection_id))
 
 
 def get_document_id() -> Optional[str]:
     """Get the current document ID from context."""
-    return _document_id.get()
+    return _get_str(_document_id)
 
 
 def set_document_id(document_id: str | UUID) -> None:
     """Set the document ID in context."""
-    _document_id.set(str(document_id))
-
+    _document_id.set(_LazyId(document_id))
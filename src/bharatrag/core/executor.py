@@ -0,0 +1,46 @@
+"""
+Bounded worker pools for running blocking calls from async request handlers.
+
+Retrieval and generation share one pool; ingestion (OCR, transcription, PDF
+extraction, possibly minutes per job) gets its own, so a burst of ingests
+cannot starve /query and /answer.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from bharatrag.core.config import get_settings
+
+T = TypeVar("T")
+
+_executor = ThreadPoolExecutor(
+    max_workers=get_settings().llm_workers,
+    thread_name_prefix="bharatrag-worker",
+)
+_ingest_executor = ThreadPoolExecutor(
+    max_workers=get_settings().ingest_workers,
+    thread_name_prefix="bharatrag-ingest",
+)
+
+
+async def _run_in(executor: Executor, func: Callable[..., T], args, kwargs) -> T:
+    # The caller's context is copied into the worker thread so request-scoped
+    # values (request_id, collection_id, ...) keep reaching the log records.
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
+async def run_blocking(func: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run a blocking retrieval/LLM callable on the shared worker pool."""
+    return await _run_in(_executor, func, args, kwargs)
+
+
+async def run_ingestion(func: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run a blocking ingestion job on the ingestion pool."""
+    return await _run_in(_ingest_executor, func, args, kwargs)
@@ -0,0 +1,55 @@
+"""
+Time-ordered UUIDs (version 7, RFC 9562) for primary keys.
+
+Random UUIDv4 keys land anywhere in the primary-key B-tree, so every insert
+dirties a random leaf page and splits pages all over the index. A UUIDv7
+starts with a millisecond Unix timestamp, so new rows append at the right
+edge of the index instead. Python 3.14 ships `uuid.uuid7`; older interpreters
+get the same layout built here from the stdlib.
+"""
+from __future__ import annotations
+
+try:
+    from uuid import uuid7
+except ImportError:  # Python < 3.14
+    import os
+    import threading
+    import time
+    from uuid import UUID
+
+    _lock = threading.Lock()
+    _last_ms = 0
+    _counter = 0
+
+    def uuid7() -> UUID:
+        """
+        48-bit ms timestamp, then a 12-bit counter (randomly seeded each
+        millisecond, RFC 9562 method 1) so ids from one process stay strictly
+        increasing, then 62 random bits.
+        """
+        global _last_ms, _counter
+        rand = int.from_bytes(os.urandom(10))
+        with _lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > _last_ms:
+                _last_ms = ms
+                # Seed below the midpoint to leave room for increments
+                _counter = (rand >> 64) & 0x7FF
+            else:
+                # Same millisecond, or the clock stepped back
+                _counter += 1
+                if _counter > 0xFFF:
+                    _last_ms += 1
+                    _counter = 0
+            ms, counter = _last_ms, _counter
+        value = (
+            (ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | rand & 0x3FFF_FFFF_FFFF_FFFF
+        )
+        return UUID(int=value)
+
+
+__all__ = ["uuid7"]
@@ -1,9 +1,15 @@
 import logging
 import sys
+import threading
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from pythonjsonlogger.json import JsonFormatter
+try:
+    # C-level encoder when orjson is installed
+    from pythonjsonlogger.orjson import OrjsonFormatter as JsonFormatter
+except ImportError:
+    from pythonjsonlogger.json import JsonFormatter
 from bharatrag.core.context import (
     get_request_id,
     get_job_id,
@@ -39,9 +45,12 @@ class BharatJsonFormatter(JsonFormatter):
     ) -> None:
         super().add_fields(log_data, record, message_dict)
         
-        # Consistent time field (RFC3339-ish)
+        # Consistent time field (RFC3339-ish), taken from the record rather
+        # than a second clock read
         if "timestamp" not in log_data:
-            log_data["timestamp"] = datetime.now(timezone.utc).isoformat()
+            log_data["timestamp"] = datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat()
         
         # Standardize level field
         log_data["level"] = record.levelname
@@ -53,11 +62,68 @@ class BharatJsonFormatter(JsonFormatter):
         if record.exc_info:
             log_data["exc_info"] = self.formatException(record.exc_info)
 
-def setup_logging(log_level: str = "INFO") -> None:
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    Stream handler that moves formatting and I/O off the logging thread.
+
+    `emit` only appends the (already context-filtered) record to a bounded ring
+    buffer; a daemon thread drains it every `flush_interval` seconds, formats
+    the batch and writes it with a single `write()`. When the buffer is full the
+    oldest records are dropped rather than blocking request handling.
+    """
+
+    def __init__(self, stream=None, *, capacity: int = 10_000, flush_interval: float = 0.005):
+        super().__init__(stream)
+        self._buffer: deque[logging.LogRecord] = deque(maxlen=capacity)
+        self._flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._writer = threading.Thread(
+            target=self._run, name="bharatrag-log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Freeze the message now: args may be mutated after the call returns
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        self._buffer.append(record)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            lines = []
+            while self._buffer:
+                record = self._buffer.popleft()
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            if lines:
+                lines.append("")
+                self.stream.write(self.terminator.join(lines))
+                super().flush()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._writer.join(timeout=1.0)
+        self.flush()
+        super().close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            if self._buffer:
+                self.flush()
+
+
+def setup_logging(log_level: str = "INFO", backend: str = "sync") -> None:
     root = logging.getLogger()
     root.setLevel(log_level)
     
-    handler = logging.StreamHandler(sys.stdout)
+    if backend == "buffered":
+        handler = BufferedStreamHandler(sys.stdout)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(log_level)
     
     formatter = BharatJsonFormatter(
@@ -1,20 +1,32 @@
 # db/models/chunk.py
 import uuid
-from sqlalchemy import DateTime, func, ForeignKey, JSON, Text, Integer
+from sqlalchemy import Computed, DateTime, func, ForeignKey, Index, JSON, Text, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, Vector
 
+from bharatrag.core.ids import uuid7
 from bharatrag.db.base import Base
 
 
 class ChunkModel(Base):
     __tablename__ = "chunks"
+    __table_args__ = (
+        # ANN index for the half-precision shortlist stage of
+        # ChunkRepository.search_similar
+        Index(
+            "ix_chunks_embedding_h_hnsw",
+            "embedding_h",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding_h": "halfvec_cosine_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     collection_id: Mapped[uuid.UUID] = mapped_column(
@@ -48,6 +60,14 @@ class ChunkModel(Base):
         nullable=False,
     )
 
+    # float16 copy maintained by Postgres; halves the bytes scanned by the ANN
+    # index, with exact float32 re-ranking on the shortlist
+    embedding_h: Mapped[list[float]] = mapped_column(
+        HALFVEC(384),
+        Computed("embedding::halfvec(384)", persisted=True),
+        nullable=False,
+    )
+
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
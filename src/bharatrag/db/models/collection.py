@@ -3,13 +3,14 @@ from sqlalchemy import String, DateTime, func, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from bharatrag.core.ids import uuid7
 from bharatrag.db.base import Base
 
 
 class CollectionModel(Base):
     __tablename__ = "collections"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
 
     created_at: Mapped[DateTime] = mapped_column(
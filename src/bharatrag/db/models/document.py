@@ -1,9 +1,10 @@
 # db/models/document.py
 import uuid
-from sqlalchemy import String, DateTime, func, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, DateTime, func, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from bharatrag.core.ids import uuid7
 from bharatrag.db.base import Base
 
 
@@ -13,7 +14,7 @@ class DocumentModel(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     collection_id: Mapped[uuid.UUID] = mapped_column(
@@ -32,7 +33,7 @@ class DocumentModel(Base):
     # keep metadata aliased safely
     extra_metadata: Mapped[dict] = mapped_column(
         "metadata",
-        JSON,
+        JSONB,
         nullable=False,
         default=dict,
     )
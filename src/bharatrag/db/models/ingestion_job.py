@@ -1,8 +1,9 @@
 import uuid
-from sqlalchemy import String, DateTime, func, ForeignKey, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, DateTime, func, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from bharatrag.core.ids import uuid7
 from bharatrag.db.base import Base
 
 
@@ -14,7 +15,7 @@ class IngestionJobModel(Base):
 
     __tablename__ = "ingestion_jobs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     collection_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -34,7 +35,7 @@ class IngestionJobModel(Base):
     format: Mapped[str] = mapped_column(String(32), nullable=False)
 
     status: Mapped[str] = mapped_column(String(16), nullable=False, default="PENDING")
-    progress: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    progress: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
 
     error_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
 
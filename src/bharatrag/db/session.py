@@ -1,9 +1,38 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from bharatrag.core.config import get_settings
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    # Reuse the most recently returned connection so idle ones can age out
+    pool_use_lifo=True,
+)
+# Repositories convert to domain models right after commit; keeping loaded
+# attributes avoids a reload SELECT on first access.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
+
+
+@contextmanager
+def unit_of_work(session_factory=SessionLocal) -> Iterator[Session]:
+    """
+    One transaction shared by several repository writes: pass the yielded
+    session to them and they skip their own commits. Commits once on exit,
+    rolls everything back if the block raises.
+    """
+    with session_factory() as session, session.begin():
+        yield session
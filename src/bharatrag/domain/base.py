@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Self
+
+from pydantic import BaseModel
+
+
+class DomainModel(BaseModel):
+    """
+    Base for read models materialized from DB rows.
+
+    Rows coming back from our own tables are already typed by SQLAlchemy, so
+    `from_orm_fast` copies the mapped attributes straight into
+    `model_construct` instead of re-running field validation per row.
+    Inbound payloads (`*Create`) keep full validation.
+
+    The field names, and a C-level `attrgetter` over them, are worked out
+    once per subclass when it is defined rather than per row.
+    """
+
+    _orm_fields: ClassVar[tuple[str, ...]] = ()
+    _orm_getter: ClassVar[Callable[[Any], tuple]] = staticmethod(lambda obj: ())
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        names = tuple(cls.model_fields)
+        cls._orm_fields = names
+        if len(names) == 1:
+            # attrgetter with one name returns the value itself, not a 1-tuple
+            getter = attrgetter(names[0])
+            cls._orm_getter = staticmethod(lambda obj: (getter(obj),))
+        elif names:
+            cls._orm_getter = staticmethod(attrgetter(*names))
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Self:
+        return cls.model_construct(**dict(zip(cls._orm_fields, cls._orm_getter(obj))))
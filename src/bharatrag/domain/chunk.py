@@ -1,20 +1,28 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping, Union
 from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 
+import numpy as np
+
+from bharatrag.domain.base import DomainModel
+
 
 class ChunkCreate(BaseModel):
+    # accept "metadata" from input, or extra_metadata when built in-process
+    model_config = ConfigDict(validate_by_name=True, arbitrary_types_allowed=True)
+
     document_id: UUID
     collection_id: UUID
     chunk_index: int = Field(ge=0)
     text: str = Field(min_length=1)
-    embedding: List[float]
+    # Embedder output rows are passed through as float32 arrays
+    embedding: Union[np.ndarray, List[float]]
     extra_metadata: Dict[str, Any] = Field(default_factory=dict, validation_alias="metadata")
 
 
-class Chunk(BaseModel):
+class Chunk(DomainModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
@@ -22,9 +30,26 @@ class Chunk(BaseModel):
     collection_id: UUID
     chunk_index: int
     text: str
-    extra_metadata: Dict[str, Any] = Field(default_factory=dict, validation_alias="metadata")
+    # No alias either way: the public /query field is "extra_metadata", and
+    # reading an ORM row never probes ChunkModel.metadata (SQLAlchemy's
+    # MetaData) first
+    extra_metadata: Dict[str, Any] = Field(default_factory=dict)
     created_at: datetime
 
-class ChunkSearchResult(BaseModel):
+class ChunkSearchResult(DomainModel):
     chunk: Chunk
     score: float
+
+    @classmethod
+    def from_search_row(cls, row: Mapping[str, Any]) -> ChunkSearchResult:
+        """Build from a `ChunkRepository.search_similar` result row without validation."""
+        chunk = Chunk.model_construct(
+            id=row["id"],
+            document_id=row["document_id"],
+            collection_id=row["collection_id"],
+            chunk_index=row["chunk_index"],
+            text=row["text"],
+            extra_metadata=row["metadata"] or {},
+            created_at=row["created_at"],
+        )
+        return cls.model_construct(chunk=chunk, score=float(row["score"]))
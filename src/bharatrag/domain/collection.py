@@ -3,12 +3,14 @@ from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 
+from bharatrag.domain.base import DomainModel
+
 
 class CollectionCreate(BaseModel):
     name: str = Field(min_length=1, max_length=255)
 
 
-class Collection(BaseModel):
+class Collection(DomainModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
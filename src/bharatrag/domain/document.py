@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from bharatrag.domain.base import DomainModel
+
 
 class DocumentCreate(BaseModel):
     collection_id: UUID
@@ -21,11 +23,11 @@ class DocumentCreate(BaseModel):
         validation_alias="metadata",
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(validate_by_name=True)
 
 
-class Document(BaseModel):
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+class Document(DomainModel):
+    model_config = ConfigDict(from_attributes=True)
 
     id: UUID
     collection_id: UUID
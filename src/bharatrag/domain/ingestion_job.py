@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional, Literal
 from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 
+from bharatrag.domain.base import DomainModel
+
 
 JobStatus = Literal["PENDING", "RUNNING", "COMPLETED", "FAILED", "PARTIAL", "CANCELED"]
 
@@ -45,7 +47,7 @@ class IngestionJobCreate(BaseModel):
     )
 
 
-class IngestionJob(BaseModel):
+class IngestionJob(DomainModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
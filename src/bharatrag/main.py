@@ -1,38 +1,86 @@
 import logging
-import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import os
+import random
+from contextlib import asynccontextmanager
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from fastapi import FastAPI
 
+from bharatrag.api.deps import get_llm_batcher, warmup
 from bharatrag.api.health import router as health_router
 from bharatrag.api.collections import router as collections_router
 from bharatrag.api.jobs import router as jobs_router
 from bharatrag.api.ingest import router as ingest_router
 from bharatrag.api.answer import router as answer_router
 from bharatrag.api.query import router as query_router
+from bharatrag.api.responses import FastJSONResponse
 from bharatrag.core.config import get_settings
 from bharatrag.core.logging_config import setup_logging
 from bharatrag.core.context import set_request_id
+from bharatrag.core.executor import run_blocking
+from bharatrag.db.session import engine
+from bharatrag.services.ingestion_handlers.website_handler import WebsiteIngestionHandler
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and inject request_id into context for logging."""
-    
-    async def dispatch(self, request: Request, call_next):
+# Request ids only need to be unique, not unpredictable: a process-local PRNG
+# avoids a getrandom() syscall per request.
+_request_id_rng = random.Random()
+# Forked workers would otherwise share the parent's sequence
+os.register_at_fork(after_in_child=_request_id_rng.seed)
+
+
+class RequestIDMiddleware:
+    """Pure ASGI middleware to generate and inject request_id into context for logging."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        request_id = f"{_request_id_rng.getrandbits(128):032x}"
         set_request_id(request_id)
-        
+        header = (b"x-request-id", request_id.encode("ascii"))
+
         # Add request_id to response headers for client correlation
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+def _warm_db_pool() -> None:
+    # Open one pooled connection up front so the first request skips the
+    # connect/auth handshake; the app still starts if the DB is not up yet.
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SELECT 1")
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            "Database pool warmup failed", extra={"error": str(e)}
+        )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load shared retriever/LLM once per worker instead of on the first request
+    warmup()
+    await run_blocking(_warm_db_pool)
+    logging.getLogger(__name__).info("Shared services warmed up")
+    yield
+    await get_llm_batcher().close()
+    WebsiteIngestionHandler.close()
+    engine.dispose()
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    setup_logging(settings.log_level)
+    setup_logging(settings.log_level, settings.log_backend)
     
     app = FastAPI(
         title="Bharat-RAG Reference Server",
@@ -41,6 +89,8 @@ def create_app() -> FastAPI:
             "Reference implementation for the Bharat-RAG Protocol (BRP)."
             "This is an early pre-alpha API skeleton."
         ),
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     
     # Add request ID middleware (should be first)
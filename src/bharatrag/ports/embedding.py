@@ -1,8 +1,11 @@
 from __future__ import annotations
 from typing import Protocol
 
+import numpy as np
+
 
 class Embedder(Protocol):
     dim: int
 
-    def embed(self, texts: list[str]) -> list[list[float]]: ...
+    # float32 array of shape (len(texts), dim)
+    def embed(self, texts: list[str]) -> np.ndarray: ...
@@ -1,6 +1,10 @@
 from __future__ import annotations
-from typing import Protocol
+from typing import Iterator, Protocol
 
 
 class LLM(Protocol):
     def generate(self, prompt: str) -> str: ...
+
+    def generate_batch(self, prompts: list[str]) -> list[str]: ...
+
+    def stream(self, prompt: str) -> Iterator[str]: ...
@@ -0,0 +1,137 @@
+"""
+Micro-batching of concurrent calls into one blocking batch call.
+
+Concurrent callers submit single items to a queue; a background task takes
+whatever is queued (up to `max_batch_size` items), runs it through one
+`batch_fn(items)` call on the worker pool, and hands each caller its own
+result. Nothing waits for more items to arrive: a lone request is dispatched
+at once, and batches form from requests that queue up while up to
+`max_concurrency` earlier batches are still running.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+from typing import Callable, Generic, Sequence, TypeVar
+
+from bharatrag.core.executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], Sequence[R]],
+        *,
+        max_batch_size: int = 8,
+        max_concurrency: int = 1,
+    ):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be > 0")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future[R]]] | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result."""
+        queue = self._ensure_worker()
+        fut: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        await queue.put((item, fut))
+        return await fut
+
+    async def close(self) -> None:
+        """Stop the background task; queued items are failed, running batches finish."""
+        worker, queue = self._worker, self._queue
+        self._worker = self._queue = self._slots = self._loop = None
+        if worker is not None:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        if queue is not None:
+            while not queue.empty():
+                _, fut = queue.get_nowait()
+                if not fut.done():
+                    fut.set_exception(RuntimeError(f"{type(self).__name__} closed"))
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # (Re)bind to the current event loop; a queue cannot be shared across loops
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._in_flight = set()
+            # Run in an empty context so batch logs don't inherit the first caller's request_id
+            self._worker = loop.create_task(
+                self._run(self._queue, self._slots), context=contextvars.Context()
+            )
+        assert self._queue is not None
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue, slots: asyncio.Semaphore) -> None:
+        while True:
+            # Wait for a free slot first, so requests pile up in the queue
+            # (and batch together) while every slot is busy
+            await slots.acquire()
+            try:
+                batch = [await queue.get()]
+            except BaseException:
+                slots.release()
+                raise
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            task = asyncio.create_task(self._dispatch(batch, slots))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(
+        self, batch: list[tuple[T, asyncio.Future[R]]], slots: asyncio.Semaphore
+    ) -> None:
+        try:
+            items = [item for item, _ in batch]
+            logger.debug(
+                "Running micro-batch",
+                extra={"batcher": type(self).__name__, "batch_size": len(items)},
+            )
+            try:
+                outputs = list(await run_blocking(self._batch_fn, items))
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+
+            if len(outputs) != len(batch):
+                # Never leave a caller waiting on a result that will not come
+                error = RuntimeError(
+                    f"{type(self).__name__}: batch_fn returned {len(outputs)} results "
+                    f"for {len(batch)} items"
+                )
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(error)
+                return
+
+            for (_, fut), out in zip(batch, outputs):
+                if not fut.done():
+                    fut.set_result(out)
+        finally:
+            slots.release()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 class SimpleChunker:
@@ -20,16 +20,46 @@ class SimpleChunker:
         if not t:
             return [(0, "")]
 
-        chunks: list[tuple[int, str]] = []
-        start = 0
-        idx = 0
-        step = self.chunk_size - self.overlap
+        # One slice per window over precomputed offsets; str.strip() returns the
+        # slice itself when there is no boundary whitespace, so it costs no copy
+        # in the common case. Windows that are all whitespace are dropped
+        # without consuming an index.
+        size = self.chunk_size
+        parts = (t[o : o + size].strip() for o in range(0, len(t), size - self.overlap))
+        return list(enumerate(p for p in parts if p))
 
-        while start < len(t):
-            part = t[start : start + self.chunk_size].strip()
-            if part:
-                chunks.append((idx, part))
-                idx += 1
-            start += step
+    def chunk_iter(self, pieces: Iterable[str]) -> Iterator[tuple[int, str]]:
+        """
+        Chunk text arriving as consecutive pieces (e.g. decoded file blocks),
+        yielding the same non-empty chunks as `chunk("".join(pieces))` while
+        holding only about one piece plus one window in memory.
+        """
+        size = self.chunk_size
+        step = size - self.overlap
+        buf = ""
+        index = 0
+        started = False
+        for piece in pieces:
+            if not started:
+                # `chunk` strips leading whitespace before placing windows
+                piece = piece.lstrip()
+                if not piece:
+                    continue
+                started = True
+            buf += piece
+            # Emit every window that is complete, then keep the unread tail
+            offset = 0
+            while offset + size <= len(buf):
+                part = buf[offset : offset + size].strip()
+                if part:
+                    yield index, part
+                    index += 1
+                offset += step
+            buf = buf[offset:]
 
-        return chunks
+        # Trailing whitespace only adds windows that strip to nothing
+        for offset in range(0, len(buf), step):
+            part = buf[offset : offset + size].strip()
+            if part:
+                yield index, part
+                index += 1
@@ -1,8 +1,17 @@
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 class EmbeddingService:
     def __init__(self):
         self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        self.dim = self.model.get_sentence_embedding_dimension()
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        return self.model.encode(texts).tolist()
+    def embed(self, texts: list[str]) -> np.ndarray:
+        # Keep the encoder's float32 matrix; no per-element Python floats
+        return self.model.encode(
+            texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(np.float32, copy=False)
@@ -0,0 +1,59 @@
+"""
+Memoizing front for Embedder.embed.
+
+Ingestion embeds every chunk it stores. Boilerplate repeated across pages and
+documents (headers, footers, disclaimers) and re-ingested documents produce
+identical chunk texts, so vectors are remembered by text and only unseen
+texts reach the wrapped embedder.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from bharatrag.ports.embedding import Embedder
+
+
+class CachingEmbedder(Embedder):
+    """
+    LRU cache of embeddings keyed by text, bounded to `max_entries` vectors.
+
+    Texts repeated within one call are also embedded once. Safe to share
+    between ingestion worker threads.
+    """
+
+    def __init__(self, embedder: Embedder, max_entries: int = 10_000):
+        self.embedder = embedder
+        self.dim = embedder.dim
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        out = np.empty((len(texts), self.dim), dtype=np.float32)
+        # text -> positions in `texts` still to be filled
+        misses: dict[str, list[int]] = {}
+
+        with self._lock:
+            for i, text in enumerate(texts):
+                vector = self._cache.get(text)
+                if vector is None:
+                    misses.setdefault(text, []).append(i)
+                else:
+                    self._cache.move_to_end(text)
+                    out[i] = vector
+
+        if not misses:
+            return out
+
+        fresh = self.embedder.embed(list(misses))
+        with self._lock:
+            for (text, positions), vector in zip(misses.items(), fresh):
+                out[positions] = vector
+                # Copy so a cached row does not keep its whole batch array alive
+                self._cache[text] = vector.copy()
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return out
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import logging
 import hashlib
+
+import numpy as np
+
 from bharatrag.ports.embedding import Embedder
 
 logger = logging.getLogger(__name__)
 
+_DIGEST_SIZE = hashlib.sha256().digest_size
+# byte b -> (b / 255) * 2 - 1
+_BYTE_TO_FLOAT = ((np.arange(256) / 255.0) * 2.0 - 1.0).astype(np.float32)
+
 
 class SimpleHashEmbedder(Embedder):
     """
@@ -15,30 +22,31 @@ class SimpleHashEmbedder(Embedder):
     """
     dim = 384
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        logger.debug("Embedding texts", extra={"text_count": len(texts), "dim": self.dim})
+    def embed(self, texts: list[str]) -> np.ndarray:
+        # Called once per ingest batch and per query; skip building the
+        # log extras unless debug logging is on
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Embedding texts", extra={"text_count": len(texts), "dim": self.dim})
         
         try:
-            out: list[list[float]] = []
-            for t in texts:
-                h = hashlib.sha256(t.encode("utf-8")).digest()
-                # Expand bytes into dim floats
-                vec = []
-                i = 0
-                while len(vec) < self.dim:
-                    b = h[i % len(h)]
-                    vec.append((b / 255.0) * 2.0 - 1.0)
-                    i += 1
-                out.append(vec)
+            # One sha256 per text, then expand all digests at once: cycle each
+            # 32-byte digest out to `dim` bytes and map bytes to [-1, 1] through
+            # a lookup table.
+            digests = b"".join(hashlib.sha256(t.encode("utf-8")).digest() for t in texts)
+            h = np.frombuffer(digests, dtype=np.uint8).reshape(len(texts), _DIGEST_SIZE)
+            reps = -(-self.dim // _DIGEST_SIZE)
+            out = _BYTE_TO_FLOAT[np.tile(h, (1, reps))[:, : self.dim]]
             
-            logger.debug(
-                "Texts embedded successfully",
-                extra={
-                    "text_count": len(texts),
-                    "embedding_count": len(out),
-                    "dim": self.dim,
-                },
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Texts embedded successfully",
+                    extra={
+                        "text_count": len(texts),
+                        "embedding_count": len(out),
+                        "dim": self.dim,
+                    },
+                )
             
             return out
         except Exception as e:
@@ -0,0 +1,45 @@
+"""
+Compute device selection for model-backed ingestion handlers (OCR, ASR).
+"""
+from __future__ import annotations
+
+import logging
+
+from bharatrag.core.config import ComputeDevice
+
+logger = logging.getLogger(__name__)
+
+
+def detect_available_devices() -> list[str]:
+    """Devices usable in this process, always including "cpu"."""
+    devices = ["cpu"]
+    try:
+        import torch
+    except ImportError:
+        return devices
+    if torch.cuda.is_available():
+        devices.append("cuda")
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        devices.append("mps")
+    return devices
+
+
+def resolve_device(device: ComputeDevice = "auto") -> str:
+    """
+    Map a requested device to one that is available: "auto" prefers CUDA,
+    then Apple MPS, then CPU; an unavailable explicit choice falls back to CPU.
+    """
+    available = detect_available_devices()
+    if device == "auto":
+        for candidate in ("cuda", "mps"):
+            if candidate in available:
+                return candidate
+        return "cpu"
+    if device not in available:
+        logger.warning(
+            "Requested device not available, using CPU",
+            extra={"device": device, "available_devices": available},
+        )
+        return "cpu"
+    return device
@@ -6,15 +6,112 @@ Extracts text from PDF files page-by-page with metadata tracking.
 from __future__ import annotations
 
 import logging
+import mmap
+import multiprocessing
+import re
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
 
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError, WrongPasswordError, FileNotDecryptedError
 
+try:
+    # PDFium (C++) text extraction; pypdf stays as the fallback
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None  # type: ignore
+
 from bharatrag.ports.ingestion_handler import IngestionHandler
 
 logger = logging.getLogger(__name__)
 
+_INLINE_WS_RE = re.compile(r"[^\S\n]+")
+_NEWLINES_RE = re.compile(r" ?\n[\n ]*")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+# PDFium keeps process-global state and is not thread-safe; ingestion jobs
+# run on a thread pool, so every pdfium call goes through this lock
+_pdfium_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by all handlers, created on first parallel extraction."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # The server is multi-threaded, so don't fork it; forkserver
+            # children start from a clean process
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next parallel extraction starts a fresh one."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_workers = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@contextmanager
+def _open_reader(path: str) -> Iterator[PdfReader]:
+    """
+    PdfReader over a read-only memory map of the file. Given a path, pypdf
+    reads the whole file into a BytesIO; mapped pages are instead faulted
+    in from the page cache as they are parsed, so a large PDF isn't held in
+    memory twice.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files can't be mapped; let pypdf report them
+            yield PdfReader(f)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield PdfReader(mm)
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> list[tuple[str | None, str | None]]:
+    """
+    Worker: extract pages [start, stop) with its own PdfReader (readers are
+    not picklable). Returns (text, error) per page so one bad page doesn't
+    lose the rest of the range.
+    """
+    out: list[tuple[str | None, str | None]] = []
+    with _open_reader(path) as reader:
+        for page_num in range(start, stop):
+            try:
+                out.append((reader.pages[page_num].extract_text(), None))
+            except Exception as e:
+                out.append((None, str(e)))
+    return out
+
+
+def _split(total: int, parts: int) -> list[tuple[int, int]]:
+    """Split range(total) into `parts` contiguous, near-equal (start, stop) slices."""
+    size, extra = divmod(total, parts)
+    bounds = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            bounds.append((start, stop))
+        start = stop
+    return bounds
+
 
 class PdfIngestionHandler(IngestionHandler):
     """
@@ -24,6 +121,15 @@ class PdfIngestionHandler(IngestionHandler):
     Handles errors gracefully to support partial success.
     """
 
+    def __init__(self, workers: int | None = None, parallel_min_pages: int = 16):
+        """
+        Args:
+            workers: Processes for pypdf extraction of large PDFs (default: CPU count)
+            parallel_min_pages: Smallest page count worth spreading over processes
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_min_pages = parallel_min_pages
+
     def extract_text(self, uri: str) -> list[tuple[str, dict]]:
         """
         Extract text from PDF file page-by-page.
@@ -35,7 +141,7 @@ class PdfIngestionHandler(IngestionHandler):
             List of (text, metadata) tuples where metadata includes:
             - page_number: 1-indexed page number
             - total_pages: Total number of pages in PDF
-            - extraction_method: "pypdf"
+            - extraction_method: "pypdfium2" when installed, else "pypdf"
         
         Raises:
             FileNotFoundError: If PDF file doesn't exist
@@ -48,37 +154,77 @@ class PdfIngestionHandler(IngestionHandler):
         if not file_path.exists():
             raise FileNotFoundError(f"PDF file not found: {file_path}")
         
+        if pdfium is not None:
+            with _pdfium_lock:
+                try:
+                    pdf = pdfium.PdfDocument(str(file_path))
+                except pdfium.PdfiumError as e:
+                    # Let pypdf open it and report encryption/corruption precisely
+                    logger.debug("pypdfium2 could not open PDF, falling back to pypdf", extra={"error": str(e)})
+                else:
+                    try:
+                        return self._extract_pages(
+                            file_path,
+                            len(pdf),
+                            lambda page_num: self._pdfium_page_text(pdf, page_num),
+                            "pypdfium2",
+                        )
+                    finally:
+                        pdf.close()
+
         logger.debug("Opening PDF file", extra={"path": str(file_path)})
         
         try:
-            reader = PdfReader(str(file_path))
-            total_pages = len(reader.pages)
-            
-            logger.info(
-                "PDF opened successfully",
-                extra={"total_pages": total_pages, "path": str(file_path)},
-            )
-            
-            results: list[tuple[str, dict]] = []
-            failed_pages: list[int] = []
-            
-            # Extract text page-by-page
-            for page_num in range(total_pages):
-                try:
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-                    
-                    # Clean up text (remove excessive whitespace)
-                    text = self._clean_text(text)
-                    
-                    metadata = {
-                        "page_number": page_num + 1,  # 1-indexed
-                        "total_pages": total_pages,
-                        "extraction_method": "pypdf",
-                    }
-                    
-                    results.append((text, metadata))
-                    
+            with _open_reader(str(file_path)) as reader:
+                total_pages = len(reader.pages)
+                page_text: Callable[[int], str] = lambda page_num: reader.pages[page_num].extract_text()
+                if self.workers > 1 and total_pages >= self.parallel_min_pages:
+                    page_text = self._parallel_page_text(file_path, total_pages)
+                return self._extract_pages(file_path, total_pages, page_text, "pypdf")
+        except (WrongPasswordError, FileNotDecryptedError) as e:
+            logger.error("PDF is encrypted", extra={"path": str(file_path), "error": str(e)})
+            raise ValueError(f"PDF is encrypted and password is required: {file_path}") from e
+        except PdfReadError as e:
+            logger.error("PDF read error", extra={"path": str(file_path), "error": str(e)})
+            raise ValueError(f"Failed to read PDF file (may be corrupted): {file_path}") from e
+        except Exception as e:
+            logger.exception("Unexpected error extracting PDF", extra={"path": str(file_path)})
+            raise
+
+    def _extract_pages(
+        self,
+        file_path: Path,
+        total_pages: int,
+        page_text: Callable[[int], str],
+        method: str,
+    ) -> list[tuple[str, dict]]:
+        """Run `page_text` over every page, keeping going past page-level failures."""
+        logger.info(
+            "PDF opened successfully",
+            extra={"total_pages": total_pages, "path": str(file_path), "extraction_method": method},
+        )
+        
+        results: list[tuple[str, dict]] = []
+        failed_pages: list[int] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        # Extract text page-by-page
+        for page_num in range(total_pages):
+            try:
+                text = page_text(page_num)
+                
+                # Clean up text (remove excessive whitespace)
+                text = self._clean_text(text)
+                
+                metadata = {
+                    "page_number": page_num + 1,  # 1-indexed
+                    "total_pages": total_pages,
+                    "extraction_method": method,
+                }
+                
+                results.append((text, metadata))
+                
+                if debug_enabled:
                     logger.debug(
                         "Page extracted successfully",
                         extra={
@@ -86,56 +232,91 @@ class PdfIngestionHandler(IngestionHandler):
                             "text_length": len(text),
                         },
                     )
-                    
-                except Exception as e:
-                    # Log page-level error but continue processing
-                    failed_pages.append(page_num + 1)
-                    logger.warning(
-                        "Failed to extract page",
-                        extra={
-                            "page_number": page_num + 1,
-                            "error": str(e),
-                        },
-                    )
-                    # Add empty text for failed page to maintain page order
-                    results.append(
-                        (
-                            "",
-                            {
-                                "page_number": page_num + 1,
-                                "total_pages": total_pages,
-                                "extraction_method": "pypdf",
-                                "extraction_error": str(e),
-                            },
-                        )
-                    )
-            
-            if failed_pages:
+                
+            except Exception as e:
+                # Log page-level error but continue processing
+                failed_pages.append(page_num + 1)
                 logger.warning(
-                    "PDF extraction completed with page-level errors",
+                    "Failed to extract page",
                     extra={
-                        "total_pages": total_pages,
-                        "failed_pages": failed_pages,
-                        "successful_pages": total_pages - len(failed_pages),
+                        "page_number": page_num + 1,
+                        "error": str(e),
                     },
                 )
-            else:
-                logger.info(
-                    "PDF extraction completed successfully",
-                    extra={"total_pages": total_pages},
+                # Add empty text for failed page to maintain page order
+                results.append(
+                    (
+                        "",
+                        {
+                            "page_number": page_num + 1,
+                            "total_pages": total_pages,
+                            "extraction_method": method,
+                            "extraction_error": str(e),
+                        },
+                    )
                 )
-            
-            return results
-            
-        except (WrongPasswordError, FileNotDecryptedError) as e:
-            logger.error("PDF is encrypted", extra={"path": str(file_path), "error": str(e)})
-            raise ValueError(f"PDF is encrypted and password is required: {file_path}") from e
-        except PdfReadError as e:
-            logger.error("PDF read error", extra={"path": str(file_path), "error": str(e)})
-            raise ValueError(f"Failed to read PDF file (may be corrupted): {file_path}") from e
-        except Exception as e:
-            logger.exception("Unexpected error extracting PDF", extra={"path": str(file_path)})
-            raise
+        
+        if failed_pages:
+            logger.warning(
+                "PDF extraction completed with page-level errors",
+                extra={
+                    "total_pages": total_pages,
+                    "failed_pages": failed_pages,
+                    "successful_pages": total_pages - len(failed_pages),
+                },
+            )
+        else:
+            logger.info(
+                "PDF extraction completed successfully",
+                extra={"total_pages": total_pages},
+            )
+        
+        return results
+
+    def _parallel_page_text(self, file_path: Path, total_pages: int) -> Callable[[int], str]:
+        """
+        Extract all pages across worker processes (pypdf is pure Python, so
+        threads would serialize on the GIL) and return a per-page lookup that
+        re-raises a page's error, for `_extract_pages`.
+        """
+        ranges = _split(total_pages, min(self.workers, total_pages))
+        logger.debug(
+            "Extracting PDF pages in parallel",
+            extra={"total_pages": total_pages, "workers": len(ranges)},
+        )
+        pool = _get_pool(self.workers)
+        try:
+            futures = [pool.submit(_extract_page_range, str(file_path), lo, hi) for lo, hi in ranges]
+            pages = [page for f in futures for page in f.result()]
+        except BrokenProcessPool:
+            # A worker died (OOM kill, crash in a C extension); every pending
+            # future fails with it. Replace the pool and do this file in-process
+            logger.warning(
+                "PDF worker pool broke, extracting serially",
+                extra={"path": str(file_path), "total_pages": total_pages},
+            )
+            _discard_pool(pool)
+            pages = _extract_page_range(str(file_path), 0, total_pages)
+
+        def page_text(page_num: int) -> str:
+            text, error = pages[page_num]
+            if error is not None:
+                raise RuntimeError(error)
+            return text or ""
+
+        return page_text
+
+    @staticmethod
+    def _pdfium_page_text(pdf, page_num: int) -> str:
+        page = pdf[page_num]
+        try:
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range()
+            finally:
+                textpage.close()
+        finally:
+            page.close()
 
     def supports(self, format: str, source_type: str) -> bool:
         """Check if this handler supports PDF format."""
@@ -156,14 +337,8 @@ class PdfIngestionHandler(IngestionHandler):
         if not text:
             return ""
         
-        # Replace multiple whitespace with single space
-        import re
-        
-        # Preserve newlines but normalize spaces
-        lines = text.split("\n")
-        cleaned_lines = [re.sub(r"\s+", " ", line.strip()) for line in lines]
-        # Remove empty lines
-        cleaned_lines = [line for line in cleaned_lines if line]
-        
-        return "\n".join(cleaned_lines)
+        # Collapse whitespace runs within lines, then every newline run (with
+        # the spaces around it) to one newline: same result as stripping and
+        # collapsing each line and dropping empty ones, in two regex passes
+        return _NEWLINES_RE.sub("\n", _INLINE_WS_RE.sub(" ", text)).strip()
 
@@ -12,6 +12,8 @@ from bharatrag.ports.ingestion_handler import IngestionHandler
 
 logger = logging.getLogger(__name__)
 
+_READ_BUFFER_BYTES = 1 << 20
+
 
 class TextIngestionHandler(IngestionHandler):
     """
@@ -20,6 +22,14 @@ class TextIngestionHandler(IngestionHandler):
     Reads text directly from files or treats URI as raw content.
     """
 
+    def __init__(self, segment_chars: int = 64 * 1024 * 1024):
+        """
+        Args:
+            segment_chars: Files longer than this are returned as several
+                (text, metadata) segments, split at line ends
+        """
+        self.segment_chars = segment_chars
+
     def extract_text(self, uri: str) -> list[tuple[str, dict]]:
         """
         Extract text from file or raw string.
@@ -42,14 +52,22 @@ class TextIngestionHandler(IngestionHandler):
             
             if file_path.exists() and file_path.is_file():
                 logger.debug("Loading text from file", extra={"path": str(file_path)})
-                text = file_path.read_text(encoding="utf-8", errors="ignore")
+                segments = self._read_segments(file_path)
                 metadata = {
                     "source": "file",
                     "extraction_method": "text_handler",
                     "file_path": str(file_path),
                 }
-                logger.debug("Text loaded from file", extra={"text_length": len(text)})
-                return [(text, metadata)]
+                logger.debug(
+                    "Text loaded from file",
+                    extra={"text_length": sum(map(len, segments)), "segments": len(segments)},
+                )
+                if len(segments) <= 1:
+                    return [(segments[0] if segments else "", metadata)]
+                return [
+                    (segment, {**metadata, "segment_index": i, "total_segments": len(segments)})
+                    for i, segment in enumerate(segments)
+                ]
             
             # Fallback: treat as raw content
             logger.debug("Treating URI as raw text content", extra={"text_length": len(uri)})
@@ -81,6 +99,20 @@ class TextIngestionHandler(IngestionHandler):
             return True
         return False
 
+    def _read_segments(self, file_path: Path) -> list[str]:
+        """
+        Decode the file incrementally (read_text holds the raw bytes and the
+        decoded str at once) in pieces of about `segment_chars` characters.
+        Each piece is extended to the end of its line so words aren't split.
+        """
+        segments: list[str] = []
+        with open(
+            file_path, "r", encoding="utf-8", errors="ignore", buffering=_READ_BUFFER_BYTES
+        ) as fh:
+            while part := fh.read(self.segment_chars):
+                segments.append(part + fh.readline())
+        return segments
+
     def _resolve_path(self, uri: str) -> Path:
         """Resolve URI to file path."""
         if uri.startswith("file://"):
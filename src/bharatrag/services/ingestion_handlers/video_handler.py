@@ -5,22 +5,122 @@ Extracts audio from video and transcribes using Whisper with timestamp metadata.
 """
 from __future__ import annotations
 
+import json
 import logging
-import tempfile
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+import numpy as np
 
 try:
-    import whisper
+    # Only used to read video metadata when ffprobe is not on PATH
     from moviepy import VideoFileClip
 except ImportError:
-    whisper = None  # type: ignore
     VideoFileClip = None  # type: ignore
 
+try:
+    # CTranslate2 port of Whisper with int8 kernels; preferred when installed
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None  # type: ignore
+
+try:
+    import whisper
+except ImportError:
+    whisper = None  # type: ignore
+
 from bharatrag.ports.ingestion_handler import IngestionHandler
+from bharatrag.services.ingestion_handlers._device import resolve_device
 
 logger = logging.getLogger(__name__)
 
+# Whisper's input format: 16 kHz mono
+_SAMPLE_RATE = 16_000
+
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_whisper(model_size: str, device: str, backend: str) -> Any:
+    logger.info(f"Loading Whisper model: {model_size}", extra={"device": device, "extraction_method": backend})
+    if backend == "faster-whisper":
+        return WhisperModel(
+            model_size,
+            device=device,
+            compute_type="int8_float16" if device == "cuda" else "int8",
+        )
+    return whisper.load_model(model_size, device=device)
+
+
+def _get_whisper(model_size: str, device: str, backend: str) -> Any:
+    """
+    Process-wide Whisper model per (size, device, backend): the weights are
+    loaded once and shared by every handler instance.
+    """
+    # lru_cache does not stop concurrent first calls from each loading the weights
+    with _model_lock:
+        return _load_whisper(model_size, device, backend)
+
+
+def _probe(file_path: Path) -> tuple[float | None, bool]:
+    """
+    Read (duration in seconds, has an audio stream) with ffprobe, which only
+    parses the container headers. Falls back to opening a moviepy clip when
+    ffprobe is not on PATH.
+    """
+    if shutil.which("ffprobe") is None:
+        if VideoFileClip is None:
+            raise RuntimeError("ffprobe (or moviepy) is required to read video metadata")
+        video = VideoFileClip(str(file_path))
+        try:
+            return video.duration, video.audio is not None
+        finally:
+            video.close()
+
+    proc = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-print_format", "json",
+            "-show_entries", "format=duration:stream=codec_type",
+            str(file_path),
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"ffprobe failed to read video: {proc.stderr.decode(errors='replace').strip()}"
+        )
+    meta = json.loads(proc.stdout)
+    duration = meta.get("format", {}).get("duration")
+    has_audio = any(stream.get("codec_type") == "audio" for stream in meta.get("streams", []))
+    return (float(duration) if duration else None), has_audio
+
+
+def _decode_audio(file_path: Path) -> np.ndarray:
+    """
+    Decode the audio track to 16 kHz mono float32 samples through an ffmpeg
+    pipe, so no intermediate WAV file is written to disk and read back.
+    """
+    proc = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", str(file_path),
+            "-vn", "-f", "s16le", "-ac", "1", "-ar", str(_SAMPLE_RATE),
+            "-",
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed to decode audio: {proc.stderr.decode(errors='replace').strip()}"
+        )
+    return np.frombuffer(proc.stdout, np.int16).astype(np.float32) / 32768.0
+
 
 class VideoIngestionHandler(IngestionHandler):
     """
@@ -39,8 +139,6 @@ class VideoIngestionHandler(IngestionHandler):
                        Default: "base" for balance of speed and accuracy
         """
         self.model_size = model_size
-        self._model: Any = None
-        self._model_loaded = False
 
     def extract_text(self, uri: str) -> list[tuple[str, dict]]:
         """
@@ -56,24 +154,24 @@ class VideoIngestionHandler(IngestionHandler):
             - timestamp_start: Start time in seconds
             - timestamp_end: End time in seconds
             - segment_index: Segment number (0-indexed)
-            - extraction_method: "whisper"
+            - extraction_method: "faster-whisper" when installed, else "whisper"
             - language: Detected language code
         
         Raises:
             FileNotFoundError: If video file doesn't exist
             ValueError: If URI is invalid or transcription fails
         """
-        if whisper is None or VideoFileClip is None:
+        if whisper is None and WhisperModel is None:
             raise ValueError(
                 "Video processing dependencies not installed. "
-                "Install openai-whisper and moviepy: pip install openai-whisper moviepy"
+                "Install faster-whisper (or openai-whisper): "
+                "pip install faster-whisper"
             )
         
-        # Check if ffmpeg is available (required by moviepy)
-        import shutil
+        # ffmpeg decodes the audio track
         if shutil.which("ffmpeg") is None:
             raise ValueError(
-                "ffmpeg is not installed. MoviePy requires ffmpeg to extract audio from videos. "
+                "ffmpeg is not installed. ffmpeg is required to extract audio from videos. "
                 "Install ffmpeg:\n"
                 "  macOS: brew install ffmpeg\n"
                 "  Ubuntu/Debian: sudo apt-get install ffmpeg\n"
@@ -88,29 +186,26 @@ class VideoIngestionHandler(IngestionHandler):
         
         logger.debug("Loading video file", extra={"path": str(file_path)})
         
-        audio_path: Path | None = None
-        
         try:
-            # Load video to extract audio
-            logger.debug("Extracting audio from video")
-            video = VideoFileClip(str(file_path))
+            # Read container metadata
+            duration, has_audio = _probe(file_path)
             
-            if video.audio is None:
+            if not has_audio:
                 logger.warning("Video has no audio track", extra={"path": str(file_path)})
-                video.close()
                 # Return empty transcript with metadata
-                return [(
-                    "",
-                    {
-                        "source": "video",
-                        "filename": file_path.name,
-                        "format": file_path.suffix[1:].lower() if file_path.suffix else "unknown",
-                        "extraction_method": "whisper",
-                        "error": "No audio track found in video",
-                    },
-                )]
+                return [
+                    (
+                        "",
+                        {
+                            "source": "video",
+                            "filename": file_path.name,
+                            "format": file_path.suffix[1:].lower() if file_path.suffix else "unknown",
+                            "extraction_method": self._method,
+                            "error": "No audio track found in video",
+                        },
+                    )
+                ]
             
-            duration = video.duration
             logger.info(
                 "Video loaded successfully",
                 extra={
@@ -118,49 +213,22 @@ class VideoIngestionHandler(IngestionHandler):
                     "duration": duration,
                 },
             )
+
+            # Decode audio straight into memory
+            audio = _decode_audio(file_path)
+            logger.debug("Audio extracted successfully", extra={"samples": len(audio)})
             
-            # Extract audio to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_audio:
-                audio_path = Path(tmp_audio.name)
-                logger.debug("Extracting audio to temporary file", extra={"audio_path": str(audio_path)})
-                # moviepy 2.x doesn't support verbose/logger parameters
-                video.audio.write_audiofile(str(audio_path))
-            
-            video.close()
-            logger.debug("Audio extracted successfully")
-            
-            # Load Whisper model (lazy load)
-            if not self._model_loaded:
-                logger.info(f"Loading Whisper model: {self.model_size}")
-                self._model = whisper.load_model(self.model_size)
-                self._model_loaded = True
-                logger.info("Whisper model loaded")
-            
-            # Transcribe audio
-            logger.debug("Transcribing audio with Whisper")
-            result = self._model.transcribe(
-                str(audio_path),
-                verbose=False,
-            )
-            
-            # Extract segments with timestamps
-            segments = result.get("segments", [])
-            language = result.get("language", "unknown")
-            
-            logger.info(
-                "Transcription completed",
-                extra={
-                    "path": str(file_path),
-                    "segments_count": len(segments),
-                    "language": language,
-                    "duration": duration,
-                },
-            )
+            # Transcribe audio; faster-whisper decodes segments as they are consumed
+            logger.debug("Transcribing audio with Whisper", extra={"extraction_method": self._method})
+            language, segments = self._transcribe(audio)
             
-            # Convert segments to (text, metadata) tuples
+            # Convert segments to (text, metadata) tuples as they arrive
             results: list[tuple[str, dict]] = []
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            segments_count = 0
             
             for i, segment in enumerate(segments):
+                segments_count += 1
                 text = segment.get("text", "").strip()
                 start_time = segment.get("start", 0.0)
                 end_time = segment.get("end", 0.0)
@@ -175,39 +243,32 @@ class VideoIngestionHandler(IngestionHandler):
                     "timestamp_start": start_time,
                     "timestamp_end": end_time,
                     "segment_index": i,
-                    "extraction_method": "whisper",
+                    "extraction_method": self._method,
                     "language": language,
                 }
                 
                 results.append((text, metadata))
                 
-                logger.debug(
-                    "Transcription segment",
-                    extra={
-                        "segment_index": i,
-                        "start": start_time,
-                        "end": end_time,
-                        "text_preview": text[:50],
-                    },
-                )
-            
-            # If no segments, return full transcript as single chunk
-            if not results:
-                full_text = result.get("text", "").strip()
-                if full_text:
-                    results.append((
-                        full_text,
-                        {
-                            "source": "video",
-                            "filename": file_path.name,
-                            "format": file_path.suffix[1:].lower() if file_path.suffix else "unknown",
-                            "timestamp_start": 0.0,
-                            "timestamp_end": duration,
-                            "segment_index": 0,
-                            "extraction_method": "whisper",
-                            "language": language,
+                if debug_enabled:
+                    logger.debug(
+                        "Transcription segment",
+                        extra={
+                            "segment_index": i,
+                            "start": start_time,
+                            "end": end_time,
+                            "text_preview": text[:50],
                         },
-                    ))
+                    )
+            
+            logger.info(
+                "Transcription completed",
+                extra={
+                    "path": str(file_path),
+                    "segments_count": segments_count,
+                    "language": language,
+                    "duration": duration,
+                },
+            )
             
             return results
             
@@ -216,17 +277,35 @@ class VideoIngestionHandler(IngestionHandler):
         except Exception as e:
             logger.exception("Failed to extract text from video", extra={"path": str(file_path)})
             raise ValueError(f"Failed to extract text from video: {e}") from e
-        finally:
-            # Clean up temporary audio file
-            if audio_path and audio_path.exists():
-                try:
-                    audio_path.unlink()
-                    logger.debug("Cleaned up temporary audio file")
-                except Exception as cleanup_error:
-                    logger.warning(
-                        "Failed to clean up temporary audio file",
-                        extra={"path": str(audio_path), "error": str(cleanup_error)},
-                    )
+
+    @property
+    def _method(self) -> str:
+        return "faster-whisper" if WhisperModel is not None else "whisper"
+
+    def _load_model(self) -> Any:
+        """Shared Whisper model for this handler's size on the best available device."""
+        # Both backends run on CUDA or CPU (MPS lacks ops Whisper needs)
+        device = "cuda" if resolve_device("auto") == "cuda" else "cpu"
+        return _get_whisper(self.model_size, device, self._method)
+
+    def _transcribe(self, audio: np.ndarray) -> tuple[str, Iterator[dict]]:
+        """
+        Transcribe 16 kHz mono float32 samples with whichever backend is installed.
+
+        Returns the detected language and the segments as openai-whisper shapes
+        them ({"text", "start", "end"}). With faster-whisper the segments are
+        decoded lazily, as the iterator is consumed.
+        """
+        model = self._load_model()
+        if WhisperModel is None:
+            result = model.transcribe(audio, verbose=False)
+            return result.get("language", "unknown"), iter(result.get("segments", []))
+
+        segments, info = model.transcribe(audio, beam_size=5, vad_filter=True)
+        return info.language, (
+            {"text": segment.text, "start": segment.start, "end": segment.end}
+            for segment in segments
+        )
 
     def supports(self, format: str, source_type: str) -> bool:
         """Check if this handler supports video formats."""
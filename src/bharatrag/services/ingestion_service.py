@@ -1,7 +1,19 @@
+import contextvars
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
+from stat import S_ISREG
+from typing import Callable, Iterable, Iterator
 from uuid import UUID
 
+from sqlalchemy.orm import Session
+
+from bharatrag.core.config import get_settings
+from bharatrag.db.session import SessionLocal, unit_of_work
 from bharatrag.domain.ingestion_job import IngestionJob, IngestionJobCreate
 from bharatrag.domain.document import Document, DocumentCreate
 from bharatrag.domain.chunk import ChunkCreate
@@ -12,8 +24,10 @@ from bharatrag.services.repositories.chunk_repository import ChunkRepository
 from bharatrag.services.repositories.collection_repository import CollectionRepository
 
 from bharatrag.services.chunking.simple_chunker import SimpleChunker
+from bharatrag.services.embeddings.caching_embedder import CachingEmbedder
 from bharatrag.services.embeddings.simple_hash_embedder import SimpleHashEmbedder
 from bharatrag.core.context import set_job_id, set_collection_id, set_document_id
+from bharatrag.ports.embedding import Embedder
 from bharatrag.ports.ingestion_handler import IngestionHandler
 from bharatrag.services.ingestion_handlers.image_handler import ImageIngestionHandler
 from bharatrag.services.ingestion_handlers.pdf_handler import PdfIngestionHandler
@@ -22,6 +36,53 @@ from bharatrag.services.ingestion_handlers.video_handler import VideoIngestionHa
 from bharatrag.services.ingestion_handlers.website_handler import WebsiteIngestionHandler
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Local files at least this large are decoded and chunked as a stream
+_STREAM_MIN_BYTES = 8 << 20
+_STREAM_READ_CHARS = 1 << 20
+_FILE_SCHEME = "file://"
+
+# Failure statuses are written here so a slow or unreachable database cannot
+# hold the error response for longer than _FAILED_STATUS_TIMEOUT seconds
+_status_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bharatrag-job-status")
+_FAILED_STATUS_TIMEOUT = 2.0
+
+
+class _ProgressThrottle:
+    """
+    Coalesces one job's frequent progress updates (e.g. per PDF page) into at
+    most one write per `interval` seconds or per `every` updates, whichever
+    comes first. Only the latest progress is written; `flush` writes it now.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[dict], object],
+        *,
+        interval: float = 0.5,
+        every: int = 50,
+    ):
+        self._write = write
+        self._interval = interval
+        self._every = every
+        self._pending: dict | None = None
+        self._count = 0
+        self._last = time.monotonic()
+
+    def set(self, progress: dict) -> None:
+        self._pending = progress
+        self._count += 1
+        if self._count >= self._every or time.monotonic() - self._last >= self._interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending is None:
+            return
+        self._write(self._pending)
+        self._pending = None
+        self._count = 0
+        self._last = time.monotonic()
 
 
 class IngestionService:
@@ -32,31 +93,43 @@ class IngestionService:
         chunk_repo: ChunkRepository | None = None,
         collection_repo: CollectionRepository | None = None,
         handlers: list[IngestionHandler] | None = None,
+        session_factory=SessionLocal,
     ):
         self.repo = repo or IngestionJobRepository()
         self.document_repo = document_repo or DocumentRepository()
         self.chunk_repo = chunk_repo or ChunkRepository()
         self.collection_repo = collection_repo or CollectionRepository()
+        self._session_factory = session_factory
 
         self.chunker = SimpleChunker()
-        self.embedder = SimpleHashEmbedder()
+        self.embedder: Embedder = SimpleHashEmbedder()
+        if settings.ingest_embed_cache_entries:
+            self.embedder = CachingEmbedder(
+                self.embedder, max_entries=settings.ingest_embed_cache_entries
+            )
         
         # Register format handlers
         self.handlers: list[IngestionHandler] = handlers or [
-            PdfIngestionHandler(),
+            PdfIngestionHandler(
+                workers=settings.pdf_workers,
+                parallel_min_pages=settings.pdf_parallel_min_pages,
+            ),
             TextIngestionHandler(),
-            ImageIngestionHandler(),
+            ImageIngestionHandler(
+                device=settings.ocr_device,
+                quantize=settings.ocr_quantize,
+                half=settings.ocr_half,
+            ),
             VideoIngestionHandler(),
-            WebsiteIngestionHandler(),
+            WebsiteIngestionHandler(max_bytes=settings.web_max_bytes),
         ]
+        # (format, source_type) -> handler, filled on first match
+        self._handler_map: dict[tuple[str, str], IngestionHandler] = {}
 
     def ingest(self, payload: IngestionJobCreate) -> IngestionJob:
-        # Request validation BEFORE job creation
+        # Request validation BEFORE job creation (includes the collection check,
+        # so a missing collection is a clean error, not a 500)
         self._validate_request(payload)
-            
-        # Validate collection exists -> if not, return clean error (no 500)
-        if self.collection_repo.get(payload.collection_id) is None:
-            raise ValueError(f"collection_id not found: {payload.collection_id}")
 
         job = self.repo.create(payload)
         # Set context for logging
@@ -84,12 +157,40 @@ class IngestionService:
             return job
         except Exception as exc:
             logger.exception("Ingestion job failed")
-            return self.repo.update_status(job.id, "FAILED", error_summary=str(exc))
+            return self._mark_failed(job, str(exc))
+
+    def _mark_failed(self, job: IngestionJob, error_summary: str) -> IngestionJob:
+        """
+        Best-effort FAILED status write. Waits up to `_FAILED_STATUS_TIMEOUT`
+        seconds for it; past that (or if the write itself fails) the failed
+        job is returned as built here and the write, if still running,
+        finishes in the background.
+        """
+        future = _status_executor.submit(
+            contextvars.copy_context().run,
+            self.repo.update_status,
+            job.id,
+            "FAILED",
+            error_summary=error_summary,
+        )
+        try:
+            return future.result(timeout=_FAILED_STATUS_TIMEOUT)
+        except TimeoutError:
+            logger.warning("Recording job failure timed out; it continues in the background")
+        except Exception:
+            logger.exception("Recording job failure failed")
+        return job.model_copy(
+            update={
+                "status": "FAILED",
+                "error_summary": error_summary,
+                "completed_at": datetime.now(timezone.utc),
+            }
+        )
 
     def _validate_request(self, payload: IngestionJobCreate) -> None:
         logger.debug("Validating ingestion request", extra={"collection_id": str(payload.collection_id)})
         
-        if self.collection_repo.get(payload.collection_id) is None:
+        if not self.collection_repo.exists(payload.collection_id):
             logger.error("Collection not found for ingestion", extra={"collection_id": str(payload.collection_id)})
             raise ValueError(f"collection_id not found: {payload.collection_id}")
     
@@ -118,114 +219,95 @@ class IngestionService:
             - progress: Additional progress info
             - error_summary: Error details if partial
             - failed_pages: List of failed page numbers (for PDFs)
-        """
-        # 1) Create document row first
-        document = self.document_repo.create(
-            DocumentCreate(
-                collection_id=payload.collection_id,
-                source_type=payload.source_type,
-                format=payload.format,
-                uri=payload.uri,
-                extra_metadata={},
-            )
-        )
-        set_document_id(document.id)
-        self.repo.update_status(job_id, "RUNNING", progress={"stage": "document_created"})
-        logger.info("Document created")
 
-        # 2) Get appropriate handler
+        The document row and all of its chunks are written in one transaction:
+        one commit per job instead of one per chunk batch, and a failed job
+        leaves no half-stored document behind. Handler extraction (OCR,
+        transcription, PDF parsing) runs before that transaction opens, so no
+        pooled connection sits idle in it meanwhile. Job status and progress
+        are still committed on their own so pollers see them while this runs.
+        """
+        # 1) Get appropriate handler and extract outside the transaction
         handler = self._get_handler(payload.format, payload.source_type)
-        
+        extracted_pages: list[tuple[str, dict]] | None = None
         if handler:
             logger.debug(
                 "Using handler for extraction",
                 extra={"format": payload.format, "source_type": payload.source_type},
             )
-            return self._process_with_handler(handler, payload, document, job_id)
-        else:
+            extracted_pages = handler.extract_text(payload.uri)
+            logger.info(
+                "Content extracted by handler",
+                extra={
+                    "format": payload.format,
+                    "total_pages": len(extracted_pages),
+                },
+            )
+
+        with unit_of_work(self._session_factory) as session:
+            # 2) Create document row
+            document = self.document_repo.create(
+                DocumentCreate(
+                    collection_id=payload.collection_id,
+                    source_type=payload.source_type,
+                    format=payload.format,
+                    uri=payload.uri,
+                    extra_metadata={},
+                ),
+                session=session,
+            )
+            set_document_id(document.id)
+            self.repo.update_status(job_id, "RUNNING", progress={"stage": "document_created"})
+            logger.info("Document created")
+
+            if extracted_pages is not None:
+                return self._process_with_handler(
+                    extracted_pages, payload, document, job_id, session
+                )
             # Fallback to legacy text loading
             logger.debug("No handler found, using legacy text loading")
-            return self._process_legacy_text(payload, document, job_id)
+            return self._process_legacy_text(payload, document, job_id, session)
 
     def _get_handler(self, format: str, source_type: str) -> IngestionHandler | None:
-        """Find handler that supports the given format and source_type."""
+        """
+        Find handler that supports the given format and source_type.
+
+        The handler list is fixed and `supports` is a pure check, so the first
+        scan for a pair is remembered and later requests are a dict lookup.
+        Only matches are stored: the map stays bounded by the supported
+        pairs however many unknown formats are requested.
+        """
+        key = (format, source_type)
+        handler = self._handler_map.get(key)
+        if handler is not None:
+            return handler
         for handler in self.handlers:
             if handler.supports(format, source_type):
+                self._handler_map[key] = handler
                 return handler
         return None
 
     def _process_with_handler(
         self,
-        handler: IngestionHandler,
+        extracted_pages: list[tuple[str, dict]],
         payload: IngestionJobCreate,
         document: Document,
         job_id: UUID,
+        session: Session | None = None,
     ) -> dict:
-        """Process ingestion using a format-specific handler."""
-        # Extract text and metadata from handler
-        extracted_pages = handler.extract_text(payload.uri)
-        
+        """Chunk, embed and store the pages a format-specific handler extracted."""
         total_pages = len(extracted_pages)
         failed_pages: list[int] = []
-        successful_chunks = 0
         
-        logger.info(
-            "Content extracted by handler",
-            extra={
-                "format": payload.format,
-                "total_pages": total_pages,
-            },
+        # 3-5) Chunk, embed and persist. Chunks are produced lazily and stored
+        # one batch at a time, so only a single batch is held in memory.
+        successful_chunks = self._embed_and_persist(
+            document,
+            self._iter_chunks(extracted_pages, payload, job_id, failed_pages),
+            session,
         )
         
-        # Process each extracted page/text segment
-        all_chunks: list[tuple[str, dict]] = []
-        
-        for page_idx, (text, page_metadata) in enumerate(extracted_pages):
-            # Update progress for PDFs
-            if payload.format == "pdf" and "page_number" in page_metadata:
-                page_num = page_metadata.get("page_number", page_idx + 1)
-                self.repo.update_status(
-                    job_id,
-                    "RUNNING",
-                    progress={
-                        "stage": "extracting",
-                        "current_page": page_num,
-                        "total_pages": page_metadata.get("total_pages", total_pages),
-                        "pages_processed": page_idx + 1,
-                    },
-                )
-                logger.debug(
-                    "Processing PDF page",
-                    extra={
-                        "page_number": page_num,
-                        "text_length": len(text),
-                    },
-                )
-            
-            # Track failed pages (empty text with error metadata)
-            if not text and page_metadata.get("extraction_error"):
-                failed_pages.append(page_metadata.get("page_number", page_idx + 1))
-                logger.warning(
-                    "Skipping failed page",
-                    extra={
-                        "page_number": page_metadata.get("page_number"),
-                        "error": page_metadata.get("extraction_error"),
-                    },
-                )
-                continue
-            
-            # Chunk this page's text
-            chunks = self.chunker.chunk(text)
-            for chunk_idx, (_, chunk_text) in enumerate(chunks):
-                if chunk_text:
-                    # Merge page metadata with chunk info
-                    chunk_metadata = {
-                        **page_metadata,
-                        "chunk_index_in_page": chunk_idx,
-                    }
-                    all_chunks.append((chunk_text, chunk_metadata))
-        
-        if not all_chunks:
+        if not successful_chunks:
             # No valid chunks extracted
             if failed_pages:
                 return {
@@ -242,36 +324,7 @@ class IngestionService:
                     "failed_pages": [],
                 }
         
-        # Update progress
-        self.repo.update_status(
-            job_id, "RUNNING", progress={"stage": "chunked", "chunks": len(all_chunks)}
-        )
-        logger.info("Content chunked", extra={"chunk_count": len(all_chunks)})
-
-        # 4) Embed all chunks
-        chunk_texts = [chunk for chunk, _ in all_chunks]
-        embeddings = self.embedder.embed(chunk_texts)
-        self.repo.update_status(job_id, "RUNNING", progress={"stage": "embedded"})
-        logger.info("Chunks embedded", extra={"embedding_count": len(embeddings)})
-
-        # 5) Persist chunks with metadata
-        rows: list[ChunkCreate] = []
-        for chunk_idx, ((chunk_text, chunk_metadata), embedding) in enumerate(zip(all_chunks, embeddings)):
-            rows.append(
-                ChunkCreate(
-                    document_id=document.id,
-                    collection_id=document.collection_id,
-                    chunk_index=chunk_idx,
-                    text=chunk_text,
-                    embedding=embedding,
-                    extra_metadata=chunk_metadata,
-                )
-            )
-            successful_chunks += 1
-
-        if rows:
-            self.chunk_repo.bulk_create(rows)
-            logger.info("Chunks persisted", extra={"chunk_count": len(rows)})
+        logger.info("Chunks persisted", extra={"chunk_count": successful_chunks})
         
         # Determine status
         result: dict = {
@@ -294,54 +347,88 @@ class IngestionService:
         
         return result
 
+    def _iter_chunks(
+        self,
+        extracted_pages: list[tuple[str, dict]],
+        payload: IngestionJobCreate,
+        job_id: UUID,
+        failed_pages: list[int],
+    ) -> Iterator[tuple[int, str, dict]]:
+        """
+        Chunk extracted pages as they are consumed, yielding
+        `(chunk_index, text, metadata)` in document order. Pages that failed
+        extraction are skipped and appended to `failed_pages`.
+        """
+        total_pages = len(extracted_pages)
+        progress = _ProgressThrottle(lambda p: self.repo.update_progress(job_id, p))
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        chunk_index = 0
+        
+        for page_idx, (text, page_metadata) in enumerate(extracted_pages):
+            # Update progress for PDFs
+            if payload.format == "pdf" and "page_number" in page_metadata:
+                page_num = page_metadata.get("page_number", page_idx + 1)
+                progress.set(
+                    {
+                        "stage": "extracting",
+                        "current_page": page_num,
+                        "total_pages": page_metadata.get("total_pages", total_pages),
+                        "pages_processed": page_idx + 1,
+                    }
+                )
+                if debug_enabled:
+                    logger.debug(
+                        "Processing PDF page",
+                        extra={
+                            "page_number": page_num,
+                            "text_length": len(text),
+                        },
+                    )
+            
+            # Track failed pages (empty text with error metadata)
+            if not text and page_metadata.get("extraction_error"):
+                failed_pages.append(page_metadata.get("page_number", page_idx + 1))
+                logger.warning(
+                    "Skipping failed page",
+                    extra={
+                        "page_number": page_metadata.get("page_number"),
+                        "error": page_metadata.get("extraction_error"),
+                    },
+                )
+                continue
+            
+            # Chunk this page's text
+            chunks = self.chunker.chunk(text)
+            for chunk_idx, (_, chunk_text) in enumerate(chunks):
+                if chunk_text:
+                    # Merge page metadata with chunk info
+                    chunk_metadata = {
+                        **page_metadata,
+                        "chunk_index_in_page": chunk_idx,
+                    }
+                    yield chunk_index, chunk_text, chunk_metadata
+                    chunk_index += 1
+        progress.flush()
+
     def _process_legacy_text(
         self,
         payload: IngestionJobCreate,
         document: Document,
         job_id: UUID,
+        session: Session | None = None,
     ) -> dict:
         """Legacy text processing for formats without handlers."""
         # 2) Load text (Weekend-3 fallback)
-        text = self._load_text(payload.uri)
+        pieces = self._load_text(payload.uri)
 
-        # 3) Chunk
-        chunks = self.chunker.chunk(text)
-        chunk_texts = [c[1] for c in chunks if c[1]]
-        if not chunk_texts:
-            chunk_texts = [""]  # ensure embed is called at least once
-
-        self.repo.update_status(
-            job_id, "RUNNING", progress={"stage": "chunked", "chunks": len(chunk_texts)}
+        # 3-5) Chunk, embed and persist, one batch of chunks at a time
+        persisted = self._embed_and_persist(
+            document,
+            ((i, chunk, {}) for i, chunk in self.chunker.chunk_iter(pieces)),
+            session,
         )
-        logger.info("Text chunked", extra={"chunk_count": len(chunk_texts)})
-
-        # 4) Embed
-        embeddings = self.embedder.embed(chunk_texts)
-        self.repo.update_status(job_id, "RUNNING", progress={"stage": "embedded"})
-        logger.info("Chunks embedded", extra={"embedding_count": len(embeddings)})
-
-        # 5) Persist chunks
-        rows: list[ChunkCreate] = []
-        emb_i = 0
-        for i, (_, chunk) in enumerate(chunks):
-            if not chunk:
-                continue
-            rows.append(
-                ChunkCreate(
-                    document_id=document.id,
-                    collection_id=document.collection_id,
-                    chunk_index=i,
-                    text=chunk,
-                    embedding=embeddings[emb_i],
-                    extra_metadata={},
-                )
-            )
-            emb_i += 1
+        logger.info("Chunks persisted", extra={"chunk_count": persisted})
 
-        if rows:
-            self.chunk_repo.bulk_create(rows)
-            logger.info("Chunks persisted", extra={"chunk_count": len(rows)})
-        
         return {
             "status": "COMPLETED",
             "progress": {},
@@ -349,32 +436,94 @@ class IngestionService:
             "failed_pages": [],
         }
 
-    def _load_text(self, uri: str | None) -> str:
+    def _embed_and_persist(
+        self,
+        document: Document,
+        items: Iterable[tuple[int, str, dict]],
+        session: Session | None = None,
+    ) -> int:
+        """
+        Embed and store `(chunk_index, text, metadata)` items `ingest_batch_size`
+        at a time, so only one batch of embeddings and rows is alive at once
+        instead of the whole document's. `items` may be a lazy iterator; it is
+        consumed batch by batch. With `session` the rows join that transaction.
+        Returns the number of chunks stored.
+        """
+        batch_size = settings.ingest_batch_size
+        document_id = document.id
+        collection_id = document.collection_id
+        embed = self.embedder.embed
+        bulk_create = self.chunk_repo.bulk_create
+        persisted = 0
+        items = iter(items)
+        while batch := list(islice(items, batch_size)):
+            embeddings = embed([text for _, text, _ in batch])
+            persisted += bulk_create(
+                [
+                    ChunkCreate(
+                        document_id=document_id,
+                        collection_id=collection_id,
+                        chunk_index=chunk_index,
+                        text=text,
+                        embedding=embedding,
+                        extra_metadata=metadata,
+                    )
+                    for (chunk_index, text, metadata), embedding in zip(batch, embeddings)
+                ],
+                session=session,
+            )
+        return persisted
+
+    def _load_text(self, uri: str | None) -> Iterable[str]:
+        """
+        Load the text behind `uri` as consecutive pieces for `chunk_iter`.
+        Small files are read in one go; large ones are decoded lazily so the
+        whole file never sits in memory as one str.
+        """
         logger.debug("Loading text from URI", extra={"uri_length": len(uri) if uri else 0})
         
         # Temp stub: handle file:// + plain paths + raw string
         if not uri:
             logger.warning("Empty URI provided, returning empty text")
-            return ""
+            return [""]
 
         try:
-            if uri.startswith("file://"):
-                path = Path(uri.removeprefix("file://"))
+            if uri.startswith(_FILE_SCHEME):
+                path = Path(uri[len(_FILE_SCHEME):])
                 logger.debug("Loading from file:// URI", extra={"path": str(path)})
-                text = path.read_text(encoding="utf-8", errors="ignore")
-                logger.debug("Text loaded from file", extra={"text_length": len(text)})
-                return text
+                return self._read_file(path, path.stat())
 
+            # One stat answers both "exists" and "is a regular file". Raw
+            # content is usually not a valid path at all (too long, NUL
+            # bytes), which surfaces as OSError/ValueError here.
             p = Path(uri)
-            if p.exists() and p.is_file():
+            try:
+                st = p.stat()
+            except (OSError, ValueError):
+                st = None
+            if st is not None and S_ISREG(st.st_mode):
                 logger.debug("Loading from file path", extra={"path": str(p)})
-                text = p.read_text(encoding="utf-8", errors="ignore")
-                logger.debug("Text loaded from file", extra={"text_length": len(text)})
-                return text
+                return self._read_file(p, st)
 
             # fallback: treat as raw content (dev-friendly)
             logger.debug("Treating URI as raw text content", extra={"text_length": len(uri)})
-            return uri
+            return [uri]
         except Exception as e:
             logger.exception("Failed to load text from URI", extra={"uri_length": len(uri) if uri else 0, "error": str(e)})
             raise
+
+    def _read_file(self, path: Path, st: os.stat_result) -> Iterable[str]:
+        size = st.st_size
+        if size < _STREAM_MIN_BYTES:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            logger.debug("Text loaded from file", extra={"text_length": len(text)})
+            return [text]
+        logger.debug("Streaming text from file", extra={"size_bytes": size})
+        return self._iter_file(path)
+
+    @staticmethod
+    def _iter_file(path: Path) -> Iterator[str]:
+        # The text layer's incremental decoder never splits a UTF-8 sequence
+        with open(path, "r", encoding="utf-8", errors="ignore", buffering=_STREAM_READ_CHARS) as fh:
+            while piece := fh.read(_STREAM_READ_CHARS):
+                yield piece
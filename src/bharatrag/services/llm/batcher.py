@@ -0,0 +1,20 @@
+"""
+Micro-batching front for LLM.generate.
+
+Concurrent requests submit prompts; they are gathered into a single
+`generate_batch` call (see services.batching.MicroBatcher). Backends whose
+`generate_batch` is a plain loop still get per-request parallelism from
+`max_concurrency` batches running side by side.
+"""
+from __future__ import annotations
+
+from bharatrag.ports.llm import LLM
+from bharatrag.services.batching import MicroBatcher
+
+
+class LLMBatcher(MicroBatcher[str, str]):
+    def __init__(self, llm: LLM, *, max_batch_size: int = 8, max_concurrency: int = 1):
+        super().__init__(
+            llm.generate_batch, max_batch_size=max_batch_size, max_concurrency=max_concurrency
+        )
+        self.llm = llm
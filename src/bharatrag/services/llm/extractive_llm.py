@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import logging
+import re
+from typing import Iterator
 
 from bharatrag.ports.llm import LLM
+from bharatrag.services.llm.prompt import (
+    CONTEXT_MARKER,
+    CONTEXT_SEPARATOR,
+    QUESTION_MARKER,
+)
 
 logger = logging.getLogger(__name__)
 
+# A word plus its trailing whitespace, so streamed pieces join back exactly
+_WORD_RE = re.compile(r"\S+\s*")
+
 
 class ExtractiveLLM(LLM):
     """
@@ -22,16 +32,19 @@ class ExtractiveLLM(LLM):
         
         try:
             # Parse prompt structure: "QUESTION:\n{question}\n\nCONTEXT:\n{chunks}"
-            if "CONTEXT:" not in prompt or "QUESTION:" not in prompt:
+            # by locating the two markers once instead of splitting the whole prompt
+            q_start = prompt.find(QUESTION_MARKER)
+            c_start = prompt.find(CONTEXT_MARKER, q_start + len(QUESTION_MARKER)) if q_start >= 0 else -1
+            if c_start < 0:
                 logger.warning("Unexpected prompt structure, returning prompt as-is")
                 return prompt
             
             # Extract question
-            question_part = prompt.split("QUESTION:")[1].split("CONTEXT:")[0].strip()
+            question_part = prompt[q_start + len(QUESTION_MARKER):c_start].strip()
             
             # Extract context chunks (separated by "\n---\n")
-            context_part = prompt.split("CONTEXT:")[1].strip()
-            chunks = [c.strip() for c in context_part.split("\n---\n") if c.strip()]
+            context_part = prompt[c_start + len(CONTEXT_MARKER):].strip()
+            chunks = [s for c in context_part.split(CONTEXT_SEPARATOR) if (s := c.strip())]
             
             logger.debug(
                 "Parsed prompt",
@@ -71,3 +84,12 @@ class ExtractiveLLM(LLM):
         except Exception as e:
             logger.exception("Answer generation failed", extra={"error": str(e)})
             raise
+
+    def generate_batch(self, prompts: list[str]) -> list[str]:
+        # Stateless and CPU-light: no shared forward pass to exploit, answer in order
+        return [self.generate(p) for p in prompts]
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        # The answer is extractive, so "tokens" are simply its words
+        for match in _WORD_RE.finditer(self.generate(prompt)):
+            yield match.group()
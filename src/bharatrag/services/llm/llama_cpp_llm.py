@@ -0,0 +1,140 @@
+"""
+llama.cpp-backed LLM for CPU inference on quantized GGUF weights.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    from llama_cpp import Llama
+except ImportError:
+    Llama = None  # type: ignore
+
+from bharatrag.ports.llm import LLM
+
+logger = logging.getLogger(__name__)
+
+
+class LlamaCppLLM(LLM):
+    """
+    Runs a GGUF model (e.g. Q4_K_M / Q8_0) through llama-cpp-python.
+
+    Weight-only quantization shrinks the bytes read per decoded token, which is
+    what bounds CPU decode speed. The model is loaded lazily on first use and
+    calls are serialized because a llama.cpp context is not thread-safe.
+    Prompts longer than `n_ctx - max_new_tokens` tokens are cut from the end,
+    which drops the lowest-ranked context chunks first.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        *,
+        quantization: str = "q4_k_m",
+        n_ctx: int = 2048,
+        max_new_tokens: int = 256,
+        n_threads: int | None = None,
+    ):
+        if max_new_tokens >= n_ctx:
+            raise ValueError(
+                f"max_new_tokens ({max_new_tokens}) must be smaller than n_ctx ({n_ctx})"
+            )
+        self.model_path = model_path
+        self.quantization = quantization
+        self.n_ctx = n_ctx
+        self.max_new_tokens = max_new_tokens
+        self.n_threads = n_threads or os.cpu_count()
+        self._model: Any = None
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str) -> str:
+        logger.debug("Generating answer with llama.cpp", extra={"prompt_length": len(prompt)})
+        with self._lock:
+            model = self._load_model()
+            out = model.create_completion(
+                self._fit_prompt(model, prompt),
+                max_tokens=self.max_new_tokens,
+                temperature=0.0,
+            )
+        text = out["choices"][0]["text"].strip()
+        logger.info("Answer generated successfully", extra={"answer_length": len(text)})
+        return text
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        logger.debug("Streaming answer with llama.cpp", extra={"prompt_length": len(prompt)})
+        # Held until the stream is exhausted or closed
+        with self._lock:
+            model = self._load_model()
+            for chunk in model.create_completion(
+                self._fit_prompt(model, prompt),
+                max_tokens=self.max_new_tokens,
+                temperature=0.0,
+                stream=True,
+            ):
+                text = chunk["choices"][0]["text"]
+                if text:
+                    yield text
+
+    def generate_batch(self, prompts: list[str]) -> list[str]:
+        # One llama.cpp context decodes one sequence at a time
+        return [self.generate(p) for p in prompts]
+
+    def _fit_prompt(self, model: Any, prompt: str) -> str | list[int]:
+        """
+        The prompt, or its first `n_ctx - max_new_tokens` tokens when it would
+        leave no room for the answer (llama.cpp rejects a prompt plus
+        max_tokens that exceed the context window).
+        """
+        budget = self.n_ctx - self.max_new_tokens
+        tokens = model.tokenize(prompt.encode("utf-8"))
+        if len(tokens) <= budget:
+            return prompt
+        logger.warning(
+            "Prompt exceeds the context window, truncating",
+            extra={"prompt_tokens": len(tokens), "max_prompt_tokens": budget},
+        )
+        # Token ids go straight to the model, so nothing is re-tokenized
+        return tokens[:budget]
+
+    def _load_model(self) -> Any:
+        if self._model is not None:
+            return self._model
+        if Llama is None:
+            raise ValueError(
+                "llama.cpp backend not installed. Install llama-cpp-python: "
+                "pip install llama-cpp-python"
+            )
+
+        path = self._resolve_model_file()
+        logger.info(
+            "Loading GGUF model",
+            extra={"path": str(path), "quantization": self.quantization, "n_threads": self.n_threads},
+        )
+        self._model = Llama(
+            model_path=str(path),
+            n_ctx=self.n_ctx,
+            n_threads=self.n_threads,
+            verbose=False,
+        )
+        logger.info("GGUF model loaded")
+        return self._model
+
+    def _resolve_model_file(self) -> Path:
+        """Accept a .gguf file, or a directory holding one .gguf per quantization."""
+        path = Path(self.model_path)
+        if path.is_file():
+            return path
+        if path.is_dir():
+            matches = sorted(
+                p for p in path.glob("*.gguf") if self.quantization in p.name.lower()
+            )
+            if matches:
+                return matches[0]
+            raise FileNotFoundError(
+                f"No {self.quantization} GGUF file found in: {path}"
+            )
+        raise FileNotFoundError(f"GGUF model not found: {path}")
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import logging
+
+from bharatrag.core.config import Settings, get_settings
+from bharatrag.ports.llm import LLM
+from bharatrag.services.llm.extractive_llm import ExtractiveLLM
+from bharatrag.services.llm.llama_cpp_llm import LlamaCppLLM
+
+logger = logging.getLogger(__name__)
+
+
+def create_llm(settings: Settings | None = None) -> LLM:
+    """Build the LLM selected by `llm_backend`. All backends share the LLM port."""
+    settings = settings or get_settings()
+
+    if settings.llm_backend == "llama_cpp":
+        if not settings.llm_gguf_path:
+            raise ValueError("llm_gguf_path is required when llm_backend is 'llama_cpp'")
+        logger.info(
+            "Using llama.cpp LLM backend",
+            extra={"quantization": settings.llm_quantization},
+        )
+        return LlamaCppLLM(
+            settings.llm_gguf_path,
+            quantization=settings.llm_quantization,
+            n_ctx=settings.llm_context_size,
+            max_new_tokens=settings.llm_max_new_tokens,
+        )
+
+    return ExtractiveLLM()
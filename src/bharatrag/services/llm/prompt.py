@@ -0,0 +1,23 @@
+"""
+RAG prompt layout shared by the answer API and the LLM adapters.
+
+The instruction prefix never changes between requests, so it is kept as a
+single precomputed constant: it is built once at import, and a model-backed
+LLM can key a prefix (tokenizer / KV) cache on `RAG_PROMPT_PREFIX` instead of
+re-processing it per request.
+"""
+from __future__ import annotations
+
+SYSTEM_INSTRUCTION = "You are Bharat-RAG (Weekend-3). Answer using ONLY the CONTEXT."
+QUESTION_MARKER = "QUESTION:"
+CONTEXT_MARKER = "CONTEXT:"
+CONTEXT_SEPARATOR = "\n---\n"
+
+# Everything before the question text
+RAG_PROMPT_PREFIX = f"{SYSTEM_INSTRUCTION}\n\n{QUESTION_MARKER}\n"
+_CONTEXT_HEADER = f"\n\n{CONTEXT_MARKER}\n"
+
+
+def build_rag_prompt(question: str, context: list[str]) -> str:
+    """Render `QUESTION:\n{question}\n\nCONTEXT:\n{chunk}\n---\n{chunk}...`."""
+    return "".join((RAG_PROMPT_PREFIX, question, _CONTEXT_HEADER, CONTEXT_SEPARATOR.join(context)))
@@ -3,57 +3,142 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import text as sql_text, bindparam
+from sqlalchemy import bindparam, insert, text as sql_text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from pgvector.sqlalchemy import Vector
+import numpy as np
 
+from bharatrag.core.config import get_settings
+from bharatrag.core.ids import uuid7
 from bharatrag.db.session import SessionLocal
 from bharatrag.db.models.chunk import ChunkModel
-from bharatrag.domain.chunk import Chunk, ChunkCreate, ChunkSearchResult
+from bharatrag.domain.chunk import ChunkCreate, ChunkSearchResult
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Built once at import so every search reuses the same statement object (and
+# SQLAlchemy's compiled-statement cache). Two stages: the half-precision HNSW
+# index (ix_chunks_embedding_h_hnsw) produces a shortlist, which is re-ranked
+# with exact float32 cosine distance. Both stages carry only ids and vectors;
+# text, metadata and the other row columns are read for the final k alone.
+#
+# pgvector applies the collection filter to what the index scan yields, so
+# the scan runs with hnsw.iterative_scan (pgvector >= 0.8) to keep going until
+# the shortlist is full. Iterative scans still stop at hnsw.max_scan_tuples,
+# so a small collection inside a large table can come back short; those
+# searches are answered by _SEARCH_EXACT_SQL instead.
+_SEARCH_SIMILAR_SQL = sql_text(
+    """
+    WITH shortlist AS (
+      SELECT id, embedding
+      FROM chunks
+      WHERE collection_id = :cid
+      ORDER BY embedding_h <=> CAST(:qvec AS halfvec(384))
+      LIMIT :shortlist
+    ),
+    ranked AS (
+      SELECT id, (1 - (embedding <=> :qvec)) AS score
+      FROM shortlist
+      ORDER BY embedding <=> :qvec
+      LIMIT :k
+    )
+    SELECT
+      c.id,
+      c.document_id,
+      c.collection_id,
+      c.chunk_index,
+      c.text,
+      c.metadata,
+      c.created_at,
+      ranked.score
+    FROM ranked
+    JOIN chunks c ON c.id = ranked.id
+    ORDER BY ranked.score DESC
+    """
+).bindparams(
+    # Use bindparam with Vector type for proper pgvector handling
+    bindparam("qvec", type_=Vector(384)),
+    bindparam("cid", type_=PG_UUID(as_uuid=True)),
+)
+
+# Exact scan over one collection. MATERIALIZED keeps the planner from
+# ordering through the HNSW index: rows are filtered by collection first
+# (ix_chunks_collection_id), then sorted by float32 distance.
+_SEARCH_EXACT_SQL = sql_text(
+    """
+    WITH members AS MATERIALIZED (
+      SELECT id, document_id, collection_id, chunk_index, text, metadata,
+             created_at, embedding
+      FROM chunks
+      WHERE collection_id = :cid
+    )
+    SELECT
+      id,
+      document_id,
+      collection_id,
+      chunk_index,
+      text,
+      metadata,
+      created_at,
+      (1 - (embedding <=> :qvec)) AS score
+    FROM members
+    ORDER BY embedding <=> :qvec
+    LIMIT :k
+    """
+).bindparams(
+    bindparam("qvec", type_=Vector(384)),
+    bindparam("cid", type_=PG_UUID(as_uuid=True)),
+)
+
+# SET LOCAL does not take bind parameters; set_config(..., true) is equivalent.
+# relaxed_order is enough because the shortlist is re-ranked exactly anyway.
+_SET_EF_SEARCH_SQL = sql_text(
+    "SELECT set_config('hnsw.ef_search', :ef, true),"
+    " set_config('hnsw.iterative_scan', 'relaxed_order', true)"
+)
 
 
 class ChunkRepository:
     def __init__(self, session_factory=SessionLocal):
         self._session_factory = session_factory
 
-    def bulk_create(self, rows: list[ChunkCreate]) -> int:
-        logger.debug(
-            "Bulk creating chunks",
-            extra={
-                "chunk_count": len(rows),
-                "document_id": str(rows[0].document_id) if rows else None,
-                "collection_id": str(rows[0].collection_id) if rows else None,
-            },
-        )
+    def bulk_create(self, rows: list[ChunkCreate], *, session: Session | None = None) -> int:
+        """
+        Insert chunk rows. With `session` the insert joins the caller's
+        transaction (see `unit_of_work`) and is not committed here.
+        """
+        # Called once per ingest batch; the ingestion service logs the total,
+        # so per-batch records are debug-only and their extras built lazily
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                "Bulk creating chunks",
+                extra={
+                    "chunk_count": len(rows),
+                    "document_id": str(rows[0].document_id) if rows else None,
+                    "collection_id": str(rows[0].collection_id) if rows else None,
+                },
+            )
         
+        if not rows:
+            return 0
+
         try:
-            with self._session_factory() as session:  # type: Session
-                models = [
-                    ChunkModel(
-                        document_id=r.document_id,
-                        collection_id=r.collection_id,
-                        chunk_index=r.chunk_index,
-                        text=r.text,
-                        embedding=r.embedding,
-                        extra_metadata=r.extra_metadata,
-                    )
-                    for r in rows
-                ]
-                session.add_all(models)
-                session.commit()
-                
-                logger.info(
+            if session is not None:
+                self._insert(session, rows)
+            else:
+                with self._session_factory() as own:  # type: Session
+                    self._insert(own, rows)
+                    own.commit()
+            
+            if debug_enabled:
+                logger.debug(
                     "Chunks bulk created successfully",
-                    extra={
-                        "chunk_count": len(models),
-                        "document_id": str(rows[0].document_id) if rows else None,
-                        "collection_id": str(rows[0].collection_id) if rows else None,
-                    },
+                    extra={"chunk_count": len(rows)},
                 )
-                
-                return len(models)
+            
+            return len(rows)
         except Exception as e:
             logger.exception(
                 "Bulk create chunks failed",
@@ -64,18 +149,45 @@ class ChunkRepository:
             )
             raise
 
+    @staticmethod
+    def _insert(session: Session, rows: list[ChunkCreate]) -> None:
+        # ORM bulk INSERT: insertmanyvalues renders it as multi-row
+        # INSERT ... VALUES statements (up to 1000 rows each, well under
+        # the bind-parameter limit), no per-object identity-map
+        # bookkeeping and no RETURNING since ids are generated client-side.
+        session.execute(
+            insert(ChunkModel),
+            [
+                {
+                    "id": uuid7(),
+                    "document_id": r.document_id,
+                    "collection_id": r.collection_id,
+                    "chunk_index": r.chunk_index,
+                    "text": r.text,
+                    "embedding": r.embedding,
+                    "extra_metadata": r.extra_metadata,
+                }
+                for r in rows
+            ],
+        )
+
     def search_similar(
         self,
         *,
         collection_id: UUID,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int = 5,
     ) -> list[ChunkSearchResult]:
         """
         Uses pgvector cosine distance: smaller distance => closer.
         We'll return score = 1 - distance to get "higher is better".
+
+        Returns `top_k` results whenever the collection holds that many chunks:
+        if the filtered index scan comes back short, the collection is
+        searched exactly instead.
         """
         top_k = max(1, min(top_k, 50))
+        shortlist = top_k * settings.retrieval_rerank_factor
         
         logger.debug(
             "Searching similar chunks",
@@ -87,53 +199,30 @@ class ChunkRepository:
         )
 
         try:
-            sql = sql_text(
-                """
-                SELECT
-                  id,
-                  document_id,
-                  collection_id,
-                  chunk_index,
-                  text,
-                  metadata,
-                  created_at,
-                  (1 - (embedding <=> :qvec)) AS score
-                FROM chunks
-                WHERE collection_id = :cid
-                ORDER BY embedding <=> :qvec
-                LIMIT :k
-                """
-            )
-
-            # Use bindparam with Vector type for proper pgvector handling
-            sql = sql.bindparams(
-                bindparam("qvec", type_=Vector(384)),
-                bindparam("cid", type_=PG_UUID(as_uuid=True)),
-            )
-
             with self._session_factory() as session:
-                rows = session.execute(
-                    sql,
-                    {
-                        "cid": collection_id,
-                        "qvec": query_embedding,
-                        "k": top_k,
-                    },
-                ).mappings().all()
-
-                out: list[ChunkSearchResult] = []
-                for r in rows:
-                    chunk = Chunk(
-                        id=r["id"],
-                        document_id=r["document_id"],
-                        collection_id=r["collection_id"],
-                        chunk_index=r["chunk_index"],
-                        text=r["text"],
-                        metadata=r["metadata"] or {},
-                        created_at=r["created_at"],
+                # Transaction-local, so pooled connections are not left with it
+                session.execute(
+                    _SET_EF_SEARCH_SQL,
+                    {"ef": str(max(settings.retrieval_ef_search, shortlist))},
+                )
+                params = {
+                    "cid": collection_id,
+                    "qvec": query_embedding,
+                    "shortlist": shortlist,
+                    "k": top_k,
+                }
+                rows = session.execute(_SEARCH_SIMILAR_SQL, params).mappings().all()
+                if len(rows) < top_k:
+                    # Either the collection is smaller than top_k or the index
+                    # scan gave up before the filter produced enough rows
+                    logger.debug(
+                        "Index scan came back short, searching exactly",
+                        extra={"result_count": len(rows), "top_k": top_k},
                     )
-                    out.append(ChunkSearchResult(chunk=chunk, score=float(r["score"])))
-                
+                    rows = session.execute(_SEARCH_EXACT_SQL, params).mappings().all()
+
+                out = [ChunkSearchResult.from_search_row(r) for r in rows]
+
                 logger.info(
                     "Similar chunks found",
                     extra={
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from uuid import UUID
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from bharatrag.db.session import SessionLocal
@@ -10,6 +13,9 @@ from bharatrag.domain.collection import CollectionCreate, Collection
 
 logger = logging.getLogger(__name__)
 
+# Collections remembered as existing by `exists`, before the oldest are dropped
+_EXISTS_MAX_ENTRIES = 10_000
+
 
 class CollectionRepository:
     """
@@ -17,8 +23,21 @@ class CollectionRepository:
     Keeps domain (Pydantic) separate from DB (SQLAlchemy).
     """
 
-    def __init__(self, session_factory=SessionLocal):
+    def __init__(self, session_factory=SessionLocal, *, exists_ttl_seconds: float = 60.0):
         self._session_factory = session_factory
+        self._exists_ttl_seconds = exists_ttl_seconds
+        # collection_id -> monotonic time it was last confirmed to exist
+        self._seen: dict[UUID, float] = {}
+        self._seen_lock = threading.Lock()
+
+    def _mark_seen(self, collection_id: UUID) -> None:
+        with self._seen_lock:
+            if len(self._seen) >= _EXISTS_MAX_ENTRIES:
+                # dicts keep insertion order: drop the oldest half
+                for key in list(self._seen)[: _EXISTS_MAX_ENTRIES // 2]:
+                    del self._seen[key]
+            self._seen.pop(collection_id, None)
+            self._seen[collection_id] = time.monotonic()
 
     def create(self, payload: CollectionCreate) -> Collection:
         logger.debug("Creating collection", extra={"collection_name": payload.name})
@@ -28,7 +47,8 @@ class CollectionRepository:
                 session.add(obj)
                 session.commit()
                 session.refresh(obj)
-                collection = Collection.model_validate(obj)
+                collection = Collection.from_orm_fast(obj)
+                self._mark_seen(collection.id)
                 logger.info(
                     "Collection created",
                     extra={"collection_id": str(collection.id), "collection_name": payload.name},
@@ -46,7 +66,7 @@ class CollectionRepository:
                 if obj is None:
                     logger.debug("Collection not found", extra={"collection_id": str(collection_id)})
                     return None
-                return Collection.model_validate(obj)
+                return Collection.from_orm_fast(obj)
         except Exception as e:
             logger.exception(
                 "Get collection failed",
@@ -54,6 +74,31 @@ class CollectionRepository:
             )
             raise
     
+    def exists(self, collection_id: UUID) -> bool:
+        """
+        Whether the collection exists. A positive answer is remembered for
+        `exists_ttl_seconds`, so bulk ingestion into one collection does not
+        SELECT it once per document; a missing collection is always re-checked.
+        """
+        seen = self._seen.get(collection_id)
+        if seen is not None and time.monotonic() - seen < self._exists_ttl_seconds:
+            return True
+
+        try:
+            with self._session_factory() as session:
+                found = session.scalar(
+                    select(CollectionModel.id).where(CollectionModel.id == collection_id)
+                ) is not None
+        except Exception as e:
+            logger.exception(
+                "Collection existence check failed",
+                extra={"collection_id": str(collection_id), "error": str(e)},
+            )
+            raise
+        if found:
+            self._mark_seen(collection_id)
+        return found
+
     def get_by_id(self, collection_id: UUID) -> CollectionModel | None:
         logger.debug("Getting collection by ID", extra={"collection_id": str(collection_id)})
         try:
@@ -77,7 +122,7 @@ class CollectionRepository:
                     .limit(limit)
                     .all()
                 )
-                collections = [Collection.model_validate(r) for r in rows]
+                collections = [Collection.from_orm_fast(r) for r in rows]
                 logger.debug(
                     "Collections listed",
                     extra={"count": len(collections), "limit": limit, "offset": offset},
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from uuid import UUID
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from bharatrag.db.session import SessionLocal
@@ -15,7 +16,11 @@ class DocumentRepository:
     def __init__(self, session_factory=SessionLocal):
         self._session_factory = session_factory
 
-    def create(self, payload: DocumentCreate) -> Document:
+    def create(self, payload: DocumentCreate, *, session: Session | None = None) -> Document:
+        """
+        Insert a document row. With `session` the insert joins the caller's
+        transaction (see `unit_of_work`) and is not committed here.
+        """
         logger.debug(
             "Creating document",
             extra={
@@ -25,27 +30,20 @@ class DocumentRepository:
             },
         )
         try:
-            with self._session_factory() as session:  # type: Session
-                obj = DocumentModel(
-                    collection_id=payload.collection_id,
-                    source_type=payload.source_type,
-                    format=payload.format,
-                    title=payload.title,
-                    uri=payload.uri,
-                    extra_metadata=payload.extra_metadata,
-                )
-                session.add(obj)
-                session.commit()
-                session.refresh(obj)
-                document = Document.model_validate(obj)
-                logger.info(
-                    "Document created",
-                    extra={
-                        "document_id": str(document.id),
-                        "collection_id": str(payload.collection_id),
-                    },
-                )
-                return document
+            if session is not None:
+                document = self._insert(session, payload)
+            else:
+                with self._session_factory() as own:  # type: Session
+                    document = self._insert(own, payload)
+                    own.commit()
+            logger.info(
+                "Document created",
+                extra={
+                    "document_id": str(document.id),
+                    "collection_id": str(payload.collection_id),
+                },
+            )
+            return document
         except Exception as e:
             logger.exception(
                 "Document creation failed",
@@ -56,6 +54,24 @@ class DocumentRepository:
             )
             raise
 
+    @staticmethod
+    def _insert(session: Session, payload: DocumentCreate) -> Document:
+        # INSERT ... RETURNING brings back server defaults (timestamps)
+        # in the same round trip instead of a refresh SELECT
+        obj = session.scalars(
+            insert(DocumentModel)
+            .values(
+                collection_id=payload.collection_id,
+                source_type=payload.source_type,
+                format=payload.format,
+                title=payload.title,
+                uri=payload.uri,
+                extra_metadata=payload.extra_metadata,
+            )
+            .returning(DocumentModel)
+        ).one()
+        return Document.from_orm_fast(obj)
+
     def get(self, document_id: UUID) -> Document | None:
         logger.debug("Getting document", extra={"document_id": str(document_id)})
         try:
@@ -64,7 +80,7 @@ class DocumentRepository:
                 if obj is None:
                     logger.debug("Document not found", extra={"document_id": str(document_id)})
                     return None
-                return Document.model_validate(obj)
+                return Document.from_orm_fast(obj)
         except Exception as e:
             logger.exception(
                 "Get document failed",
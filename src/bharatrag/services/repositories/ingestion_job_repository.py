@@ -1,6 +1,8 @@
 import logging
 from uuid import UUID
 from datetime import datetime, timezone
+from sqlalchemy import case, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
 
 from bharatrag.db.session import SessionLocal
@@ -35,7 +37,7 @@ class IngestionJobRepository:
                 session.add(obj)
                 session.commit()
                 session.refresh(obj)
-                job = IngestionJob.model_validate(obj)
+                job = IngestionJob.from_orm_fast(obj)
                 logger.info("Ingestion job created", extra={"job_id": str(job.id)})
                 return job
         except Exception as e:
@@ -56,7 +58,7 @@ class IngestionJobRepository:
                 if obj is None:
                     logger.debug("Ingestion job not found", extra={"job_id": str(job_id)})
                     return None
-                return IngestionJob.model_validate(obj)
+                return IngestionJob.from_orm_fast(obj)
         except Exception as e:
             logger.exception("Get ingestion job failed", extra={"job_id": str(job_id), "error": str(e)})
             raise
@@ -78,28 +80,30 @@ class IngestionJobRepository:
                 "has_error": error_summary is not None,
             },
         )
+        values: dict = {"status": status}
+        if status == "RUNNING":
+            values["started_at"] = datetime.now(timezone.utc)
+        if status in ("COMPLETED", "FAILED", "CANCELED"):
+            values["completed_at"] = datetime.now(timezone.utc)
+        if progress is not None:
+            values["progress"] = progress
+        if error_summary:
+            values["error_summary"] = error_summary
+
         try:
             with self._session_factory() as session:
-                obj = session.get(IngestionJobModel, job_id)
+                # Single UPDATE ... RETURNING instead of load, modify, flush, refresh
+                obj = session.scalars(
+                    update(IngestionJobModel)
+                    .where(IngestionJobModel.id == job_id)
+                    .values(**values)
+                    .returning(IngestionJobModel)
+                ).one_or_none()
                 if obj is None:
                     logger.error("Ingestion job not found for status update", extra={"job_id": str(job_id)})
                     raise ValueError("Ingestion job not found")
-
-                obj.status = status
-
-                if status == "RUNNING":
-                    obj.started_at = datetime.now(timezone.utc)
-                if status in ("COMPLETED", "FAILED", "CANCELED"):
-                    obj.completed_at = datetime.now(timezone.utc)
-
-                if progress is not None:
-                    obj.progress = progress
-                if error_summary:
-                    obj.error_summary = error_summary
-
+                job = IngestionJob.from_orm_fast(obj)
                 session.commit()
-                session.refresh(obj)
-                job = IngestionJob.model_validate(obj)
                 logger.info(
                     "Ingestion job status updated",
                     extra={
@@ -116,6 +120,37 @@ class IngestionJobRepository:
             )
             raise
 
+    def update_progress(self, job_id: UUID, progress: dict) -> None:
+        """
+        Merge `progress` into the job's progress in place (JSONB `||`).
+
+        For frequent in-flight updates (e.g. per extracted page): one UPDATE
+        with no read-back, leaving status and timestamps untouched. Keys are
+        only merged within a stage: when `progress["stage"]` differs from the
+        stored stage, `progress` replaces the whole object so keys from the
+        previous stage don't linger. `update_status(..., progress=...)`
+        always replaces it.
+        """
+        stored = IngestionJobModel.progress
+        new = type_coerce(progress, JSONB)
+        value = stored.op("||")(new)
+        if "stage" in progress:
+            value = case((stored["stage"].astext == str(progress["stage"]), value), else_=new)
+        try:
+            with self._session_factory() as session:
+                session.execute(
+                    update(IngestionJobModel)
+                    .where(IngestionJobModel.id == job_id)
+                    .values(progress=value)
+                )
+                session.commit()
+        except Exception as e:
+            logger.exception(
+                "Update ingestion job progress failed",
+                extra={"job_id": str(job_id), "error": str(e)},
+            )
+            raise
+
     def list(self, collection_id: UUID | None = None) -> list[IngestionJob]:
         logger.debug("Listing ingestion jobs", extra={"collection_id": str(collection_id) if collection_id else None})
         try:
@@ -124,7 +159,7 @@ class IngestionJobRepository:
                 if collection_id:
                     q = q.filter(IngestionJobModel.collection_id == collection_id)
                 rows = q.order_by(IngestionJobModel.created_at.desc()).all()
-                jobs = [IngestionJob.model_validate(r) for r in rows]
+                jobs = [IngestionJob.from_orm_fast(r) for r in rows]
                 logger.debug("Ingestion jobs listed", extra={"count": len(jobs)})
                 return jobs
         except Exception as e:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 from bharatrag.services.repositories.chunk_repository import ChunkRepository
 from bharatrag.services.embeddings.simple_hash_embedder import SimpleHashEmbedder
 from bharatrag.domain.chunk import ChunkSearchResult
@@ -14,25 +16,43 @@ class RetrievalService:
         self.chunk_repo = chunk_repo or ChunkRepository()
         self.embedder = SimpleHashEmbedder()
 
-    def query(self, *, collection_id, query: str, top_k: int = 5) -> list[ChunkSearchResult]:
-        logger.debug(
-            "Starting retrieval query",
-            extra={
-                "collection_id": str(collection_id),
-                "query_length": len(query),
-                "top_k": top_k,
-            },
-        )
-        
-        try:
-            qvec = self.embedder.embed([query])[0]
+    def query(
+        self,
+        *,
+        collection_id,
+        query: str,
+        top_k: int = 5,
+        query_embedding: np.ndarray | None = None,
+    ) -> list[ChunkSearchResult]:
+        """
+        Embed `query` and return the `top_k` closest chunks in the collection.
+
+        Pass `query_embedding` when the caller already embedded the query
+        (e.g. for a semantic cache lookup) to skip embedding it twice.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                "Query embedded successfully",
+                "Starting retrieval query",
                 extra={
                     "collection_id": str(collection_id),
-                    "embedding_dim": len(qvec),
+                    "query_length": len(query),
+                    "top_k": top_k,
                 },
             )
+        
+        try:
+            if query_embedding is not None:
+                qvec = query_embedding
+            else:
+                qvec = self.embedder.embed([query])[0]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Query embedded successfully",
+                    extra={
+                        "collection_id": str(collection_id),
+                        "embedding_dim": len(qvec),
+                    },
+                )
             
             results = self.chunk_repo.search_similar(
                 collection_id=collection_id,
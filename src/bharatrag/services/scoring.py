@@ -0,0 +1,29 @@
+"""
+Similarity scoring over in-process embedding matrices.
+
+Vectors are expected to be L2-normalized already (see `SemanticCache` and
+`EmbeddingService`, which normalize at embed time), so cosine similarity is a
+single matrix-vector product: one BLAS call instead of a Python loop of
+per-candidate dot products.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def cosine_topk(q: np.ndarray, matrix: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return (indices, scores) of the `k` rows of `matrix` (N, dim) most similar
+    to `q` (dim,), best first. Fewer than `k` are returned when N < k.
+    """
+    scores = matrix @ q
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp), scores[:0]
+    if k < n:
+        # O(N) selection of the k best, then sort just those
+        idx = np.argpartition(-scores, k - 1)[:k]
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+    else:
+        idx = np.argsort(-scores, kind="stable")
+    return idx, scores[idx]
@@ -0,0 +1,166 @@
+"""
+Semantic cache for RAG answers.
+
+Query embeddings are bucketed with random-projection LSH so near-duplicate
+questions land in the same bucket; a hit additionally requires a cosine
+similarity above the configured threshold against the stored vector.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Sequence
+
+import numpy as np
+
+from bharatrag.services.scoring import cosine_topk
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    vec: np.ndarray
+    value: Any
+    stored_at: float
+
+
+class SemanticCache:
+    """
+    LRU cache of values keyed by (namespace, query embedding).
+
+    - namespace: anything hashable that must match exactly (e.g. collection_id, top_k)
+    - embedding: compared approximately via LSH bucket + cosine similarity
+
+    Each scope (a namespace, or the first element of a tuple namespace) has a
+    generation that `invalidate` bumps. A caller that reads `generation()`
+    before computing a value and passes it to `set` has the write dropped if
+    the scope was invalidated in between, so a value computed from data that
+    predates the invalidation is never stored.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        nbits: int = 16,
+        threshold: float = 0.95,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        seed: int = 0,
+    ):
+        if nbits <= 0:
+            raise ValueError("nbits must be > 0")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.dim = dim
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((dim, nbits)).astype(np.float32)
+        self._buckets: OrderedDict[tuple[Hashable, bytes], list[_Entry]] = OrderedDict()
+        self._size = 0
+        self._generations: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: Hashable, vec: Sequence[float]) -> Any | None:
+        q = self._normalize(vec)
+        key = (namespace, self._bucket(q))
+        now = time.monotonic()
+
+        with self._lock:
+            entries = self._buckets.get(key)
+            if not entries:
+                return None
+
+            live = [e for e in entries if now - e.stored_at < self.ttl_seconds]
+            self._size -= len(entries) - len(live)
+            if not live:
+                del self._buckets[key]
+                return None
+            self._buckets[key] = live
+
+            idx, scores = cosine_topk(q, np.stack([e.vec for e in live]), 1)
+            if float(scores[0]) < self.threshold:
+                return None
+
+            self._buckets.move_to_end(key)
+            return live[int(idx[0])].value
+
+    def generation(self, namespace: Hashable) -> int:
+        """Current generation of `namespace`'s scope, for a later `set`."""
+        with self._lock:
+            return self._generations.get(self._scope(namespace), 0)
+
+    def set(
+        self,
+        namespace: Hashable,
+        vec: Sequence[float],
+        value: Any,
+        *,
+        generation: int | None = None,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        q = self._normalize(vec)
+        key = (namespace, self._bucket(q))
+
+        with self._lock:
+            current = self._generations.get(self._scope(namespace), 0)
+            if generation is not None and generation != current:
+                logger.debug("Semantic cache write dropped: scope invalidated since it was computed")
+                return
+            self._buckets.setdefault(key, []).append(_Entry(q, value, time.monotonic()))
+            self._buckets.move_to_end(key)
+            self._size += 1
+
+            while self._size > self.max_entries and self._buckets:
+                _, evicted = self._buckets.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate(self, namespace_prefix: Hashable) -> None:
+        """
+        Drop every entry whose namespace equals `namespace_prefix` or, for tuple
+        namespaces, starts with it (e.g. a collection_id for (collection_id, top_k)).
+        """
+        with self._lock:
+            self._generations[namespace_prefix] = self._generations.get(namespace_prefix, 0) + 1
+            stale = [
+                key
+                for key in self._buckets
+                if key[0] == namespace_prefix
+                or (isinstance(key[0], tuple) and key[0][:1] == (namespace_prefix,))
+            ]
+            for key in stale:
+                self._size -= len(self._buckets.pop(key))
+
+        if stale:
+            logger.debug("Semantic cache invalidated", extra={"buckets": len(stale)})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _scope(namespace: Hashable) -> Hashable:
+        """What `invalidate` addresses: a tuple namespace's first element, else the namespace."""
+        return namespace[0] if isinstance(namespace, tuple) and namespace else namespace
+
+    def _normalize(self, vec: Sequence[float]) -> np.ndarray:
+        q = np.asarray(vec, dtype=np.float32).reshape(-1)
+        if q.shape[0] != self.dim:
+            raise ValueError(f"Expected embedding of dim {self.dim}, got {q.shape[0]}")
+        norm = float(np.linalg.norm(q))
+        return q / norm if norm else q
+
+    def _bucket(self, q: np.ndarray) -> bytes:
+        return np.packbits(q @ self._planes > 0).tobytes()
@@ -0,0 +1,140 @@
+"""
+Tests for the streaming /answer endpoint (no database: retrieval is faked).
+"""
+import asyncio
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from bharatrag.api.answer import _RagContext, _stream_answer
+from bharatrag.api.deps import get_answer_cache, get_llm, get_retriever
+from bharatrag.domain.chunk import Chunk, ChunkSearchResult
+from bharatrag.main import app
+from bharatrag.services.embeddings.simple_hash_embedder import SimpleHashEmbedder
+from bharatrag.services.llm.extractive_llm import ExtractiveLLM
+from bharatrag.services.semantic_cache import SemanticCache
+
+
+class _FakeRetriever:
+    def __init__(self, texts: list[str]):
+        self.embedder = SimpleHashEmbedder()
+        self.texts = texts
+
+    def query(self, *, collection_id, query, top_k=5, query_embedding=None):
+        now = datetime.now(timezone.utc)
+        return [
+            ChunkSearchResult(
+                chunk=Chunk(
+                    id=uuid.uuid4(),
+                    document_id=uuid.uuid4(),
+                    collection_id=collection_id,
+                    chunk_index=i,
+                    text=text,
+                    created_at=now,
+                ),
+                score=1.0,
+            )
+            for i, text in enumerate(self.texts[:top_k])
+        ]
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = "message", None
+        for line in block.splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        events.append((event, data))
+    return events
+
+
+def _client(texts: list[str]) -> TestClient:
+    retriever = _FakeRetriever(texts)
+    cache = SemanticCache(dim=retriever.embedder.dim)
+    app.dependency_overrides[get_retriever] = lambda: retriever
+    llm = ExtractiveLLM()
+    app.dependency_overrides[get_llm] = lambda: llm
+    app.dependency_overrides[get_answer_cache] = lambda: cache
+    return TestClient(app)
+
+
+def teardown_function():
+    app.dependency_overrides.clear()
+
+
+def test_answer_streams_tokens_then_citations():
+    client = _client(["Aadhaar is a digital identity.", "UPI is a payments rail."])
+    payload = {"collection_id": str(uuid.uuid4()), "question": "What is Aadhaar?", "top_k": 2}
+
+    r = client.post("/answer", json=payload)
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_sse(r.text)
+    tokens = [data["token"] for event, data in events if event == "message"]
+    assert len(tokens) > 1
+    assert events[-1][0] == "done"
+    done = events[-1][1]
+    assert done["context"] == ["Aadhaar is a digital identity.", "UPI is a payments rail."]
+    assert [c["chunk_index"] for c in done["citations"]] == [0, 1]
+
+    # Streamed pieces reassemble into the same answer the sync route returns
+    r = client.post("/answer/sync", json=payload)
+    assert r.status_code == 200, r.text
+    assert "".join(tokens).strip() == r.json()["answer"]
+
+
+def test_extractive_stream_matches_generate():
+    llm = ExtractiveLLM()
+    prompt = "QUESTION:\nq\n\nCONTEXT:\nfirst  chunk\n---\nsecond chunk"
+    assert "".join(llm.stream(prompt)) == llm.generate(prompt)
+
+
+class _SlowStreamLLM:
+    """Streams "a", then blocks inside next() until released."""
+
+    def __init__(self):
+        self.decoding = threading.Event()
+        self.release = threading.Event()
+        self.closed = threading.Event()
+
+    def stream(self, prompt: str):
+        try:
+            yield "a"
+            self.decoding.set()
+            self.release.wait(5)
+            yield "b"
+        finally:
+            self.closed.set()
+
+
+def test_stream_closed_mid_decode_waits_for_the_worker():
+    """A client leaving while a worker is inside next() closes the stream once it returns."""
+    llm = _SlowStreamLLM()
+    rag = _RagContext(q_vec=np.zeros(4, dtype=np.float32), cache_ns=(), prompt="p")
+    cache = SemanticCache(dim=4)
+
+    async def run():
+        events = _stream_answer(llm, rag, cache, "cid")
+        assert "a" in await events.__anext__()
+        pending = asyncio.ensure_future(events.__anext__())
+        await asyncio.to_thread(llm.decoding.wait, 5)
+        # What the server does when the client disconnects
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        assert not llm.closed.is_set()
+        llm.release.set()
+        await asyncio.to_thread(llm.closed.wait, 5)
+
+    asyncio.run(run())
+
+    assert llm.closed.is_set()
@@ -0,0 +1,41 @@
+"""
+Tests for the embedding cache.
+"""
+import numpy as np
+
+from bharatrag.services.embeddings.caching_embedder import CachingEmbedder
+from bharatrag.services.embeddings.simple_hash_embedder import SimpleHashEmbedder
+
+
+class _RecordingEmbedder(SimpleHashEmbedder):
+    def __init__(self):
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        self.batches.append(list(texts))
+        return super().embed(texts)
+
+
+def test_caching_embedder_embeds_each_text_once():
+    inner = _RecordingEmbedder()
+    embedder = CachingEmbedder(inner, max_entries=100)
+
+    first = embedder.embed(["header", "body one", "header"])
+    second = embedder.embed(["body two", "header"])
+
+    assert inner.batches == [["header", "body one"], ["body two"]]
+    expected = SimpleHashEmbedder().embed(["header", "body one", "header", "body two", "header"])
+    np.testing.assert_array_equal(np.vstack([first, second]), expected)
+
+
+def test_caching_embedder_evicts_least_recently_used():
+    inner = _RecordingEmbedder()
+    embedder = CachingEmbedder(inner, max_entries=2)
+
+    embedder.embed(["a", "b"])
+    embedder.embed(["a"])  # "b" is now least recently used
+    embedder.embed(["c"])
+    embedder.embed(["a", "b"])
+
+    assert inner.batches == [["a", "b"], ["c"], ["b"]]
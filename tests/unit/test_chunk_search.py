@@ -0,0 +1,136 @@
+"""
+Tests for ChunkRepository.search_similar filling top_k for small collections.
+"""
+import os
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from bharatrag.services.repositories import chunk_repository
+from bharatrag.services.repositories.chunk_repository import ChunkRepository
+
+
+def _db_enabled() -> bool:
+    return os.getenv("BHARATRAG_RUN_DB_TESTS", "1") == "1"
+
+
+def _row(collection_id, i):
+    return {
+        "id": uuid.uuid4(),
+        "document_id": uuid.uuid4(),
+        "collection_id": collection_id,
+        "chunk_index": i,
+        "text": f"chunk {i}",
+        "metadata": {},
+        "created_at": datetime.now(timezone.utc),
+        "score": 1.0 - i / 100,
+    }
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _FilteringIndexSession:
+    """
+    Mimics pgvector post-filtering: the index scan only ever sees the first
+    `scan_limit` rows of the whole table, then the collection filter applies.
+    """
+
+    def __init__(self, table, scan_limit, statements):
+        self.table = table
+        self.scan_limit = scan_limit
+        self.statements = statements
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, stmt, params):
+        self.statements.append(stmt)
+        if stmt is chunk_repository._SET_EF_SEARCH_SQL:
+            return _Result([])
+        rows = self.table
+        if stmt is chunk_repository._SEARCH_SIMILAR_SQL:
+            rows = rows[: self.scan_limit]
+        members = [r for r in rows if r["collection_id"] == params["cid"]]
+        return _Result(members[: params["k"]])
+
+
+def test_small_collection_next_to_a_large_one_still_fills_top_k():
+    big, small = uuid.uuid4(), uuid.uuid4()
+    # The large collection dominates everything the index scan can reach
+    table = [_row(big, i) for i in range(500)] + [_row(small, i) for i in range(3)]
+    statements = []
+    repo = ChunkRepository(
+        session_factory=lambda: _FilteringIndexSession(table, 100, statements)
+    )
+    qvec = np.zeros(384, dtype=np.float32)
+
+    results = repo.search_similar(collection_id=small, query_embedding=qvec, top_k=5)
+    assert len(results) == 3
+    assert {r.chunk.collection_id for r in results} == {small}
+    assert chunk_repository._SEARCH_EXACT_SQL in statements
+
+    statements.clear()
+    results = repo.search_similar(collection_id=big, query_embedding=qvec, top_k=5)
+    assert len(results) == 5
+    assert chunk_repository._SEARCH_EXACT_SQL not in statements
+
+
+@pytest.mark.skipif(not _db_enabled(), reason="Database tests disabled")
+def test_search_fills_top_k_across_collections_of_very_different_sizes():
+    from bharatrag.domain.chunk import ChunkCreate
+    from bharatrag.domain.collection import CollectionCreate
+    from bharatrag.domain.document import DocumentCreate
+    from bharatrag.services.embeddings.simple_hash_embedder import SimpleHashEmbedder
+    from bharatrag.services.repositories.collection_repository import (
+        CollectionRepository,
+    )
+    from bharatrag.services.repositories.document_repository import DocumentRepository
+
+    embedder = SimpleHashEmbedder()
+    chunks = ChunkRepository()
+    sizes = {"big": 5000, "small": 3}
+    collection_ids = {}
+    for name, size in sizes.items():
+        collection = CollectionRepository().create(
+            CollectionCreate(name=f"search-{name}-{uuid.uuid4()}")
+        )
+        document = DocumentRepository().create(
+            DocumentCreate(collection_id=collection.id, source_type="text", format="txt")
+        )
+        texts = [f"{name} chunk {i}" for i in range(size)]
+        chunks.bulk_create(
+            [
+                ChunkCreate(
+                    document_id=document.id,
+                    collection_id=collection.id,
+                    chunk_index=i,
+                    text=text,
+                    embedding=vector,
+                    extra_metadata={},
+                )
+                for i, (text, vector) in enumerate(zip(texts, embedder.embed(texts)))
+            ]
+        )
+        collection_ids[name] = collection.id
+
+    qvec = embedder.embed(["small chunk 1"])[0]
+    small = chunks.search_similar(collection_id=collection_ids["small"], query_embedding=qvec, top_k=5)
+    big = chunks.search_similar(collection_id=collection_ids["big"], query_embedding=qvec, top_k=5)
+
+    assert len(small) == 3
+    assert small[0].chunk.text == "small chunk 1"
+    assert len(big) == 5
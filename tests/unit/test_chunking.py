@@ -0,0 +1,34 @@
+"""
+Tests for the fixed-size chunkers.
+"""
+from bharatrag.services.chunking.simple_chunker import SimpleChunker
+from bharatrag.services.chunking_service import ChunkingService
+
+
+def test_simple_chunker_windows_overlap_and_strip():
+    chunks = SimpleChunker(chunk_size=10, overlap=2).chunk("  abcdefghij klmnopqrst  ")
+    assert chunks == [(0, "abcdefghij"), (1, "ij klmnopq"), (2, "pqrst")]
+
+
+def test_simple_chunker_skips_blank_windows_without_consuming_index():
+    chunks = SimpleChunker(chunk_size=4, overlap=0).chunk("abcd" + " " * 8 + "efgh")
+    assert chunks == [(0, "abcd"), (1, "efgh")]
+
+
+def test_simple_chunker_empty_text():
+    assert SimpleChunker().chunk("   ") == [(0, "")]
+
+
+def test_simple_chunker_chunk_iter_matches_chunk_across_pieces():
+    chunker = SimpleChunker(chunk_size=10, overlap=2)
+    text = "  abcdefghij klmnopqrst" + " " * 12 + "uvwxyz  "
+    pieces = [text[:3], text[3:14], "", text[14:30], text[30:]]
+
+    expected = [c for c in chunker.chunk(text) if c[1]]
+    assert list(chunker.chunk_iter(pieces)) == expected
+    assert list(chunker.chunk_iter(["  ", ""])) == []
+
+
+def test_chunking_service_word_windows():
+    chunks = ChunkingService().chunk("a b c d e", chunk_size=3, overlap=1)
+    assert chunks == [(0, "a b c"), (1, "c d e"), (2, "e")]
@@ -0,0 +1,47 @@
+"""
+Tests for the collection repository's existence cache (no database: sessions are faked).
+"""
+import uuid
+
+from bharatrag.services.repositories import collection_repository
+from bharatrag.services.repositories.collection_repository import CollectionRepository
+
+
+class _FakeSession:
+    def __init__(self, known, calls):
+        self.known = known
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def scalar(self, stmt):
+        self.calls.append(stmt)
+        cid = stmt.whereclause.right.value
+        return cid if cid in self.known else None
+
+
+def test_exists_caches_positive_answers_until_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(collection_repository.time, "monotonic", lambda: now[0])
+    known_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    calls = []
+    repo = CollectionRepository(
+        session_factory=lambda: _FakeSession({known_id}, calls), exists_ttl_seconds=60.0
+    )
+
+    assert repo.exists(known_id) is True
+    assert repo.exists(known_id) is True
+    assert len(calls) == 1
+
+    # Misses are never cached
+    assert repo.exists(missing_id) is False
+    assert repo.exists(missing_id) is False
+    assert len(calls) == 3
+
+    now[0] += 61.0
+    assert repo.exists(known_id) is True
+    assert len(calls) == 4
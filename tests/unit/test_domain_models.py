@@ -0,0 +1,41 @@
+"""
+Tests for building domain read models from ORM rows.
+"""
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from bharatrag.domain.chunk import Chunk
+
+
+def _row(**overrides):
+    fields = {
+        "id": uuid.uuid4(),
+        "document_id": uuid.uuid4(),
+        "collection_id": uuid.uuid4(),
+        "chunk_index": 3,
+        "text": "some text",
+        "extra_metadata": {"page": 2},
+        "created_at": datetime.now(timezone.utc),
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_from_orm_fast_matches_model_construct():
+    row = _row()
+    fast = Chunk.from_orm_fast(row)
+    slow = Chunk.model_construct(**vars(row))
+
+    assert fast == slow
+    assert fast.model_fields_set == slow.model_fields_set
+    assert fast.model_dump(by_alias=True) == slow.model_dump(by_alias=True)
+
+
+def test_from_orm_fast_instances_are_independent():
+    a = Chunk.from_orm_fast(_row(text="a"))
+    b = Chunk.from_orm_fast(_row(text="b"))
+    a.text = "changed"
+
+    assert b.text == "b"
+    assert a.model_copy(update={"chunk_index": 0}).chunk_index == 0
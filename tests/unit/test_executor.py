@@ -0,0 +1,24 @@
+"""
+Tests for the blocking-call worker pools.
+"""
+import asyncio
+import threading
+
+from bharatrag.core.context import get_request_id, set_request_id
+from bharatrag.core.executor import run_blocking, run_ingestion
+
+
+def _whoami():
+    return threading.current_thread().name, get_request_id()
+
+
+def test_ingestion_runs_on_its_own_pool_with_caller_context():
+    async def main():
+        set_request_id("req-1")
+        return await run_blocking(_whoami), await run_ingestion(_whoami)
+
+    (query_thread, query_rid), (ingest_thread, ingest_rid) = asyncio.run(main())
+
+    assert query_thread.startswith("bharatrag-worker")
+    assert ingest_thread.startswith("bharatrag-ingest")
+    assert query_rid == ingest_rid == "req-1"
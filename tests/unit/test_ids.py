@@ -0,0 +1,23 @@
+"""
+Tests for time-ordered primary-key UUIDs.
+"""
+import time
+
+from bharatrag.core.ids import uuid7
+
+
+def test_uuid7_layout():
+    before = time.time_ns() // 1_000_000
+    u = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert u.version == 7
+    assert u.variant == "specified in RFC 4122"
+    assert before <= u.int >> 80 <= after
+
+
+def test_uuid7_is_strictly_increasing():
+    ids = [uuid7() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
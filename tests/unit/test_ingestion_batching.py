@@ -0,0 +1,257 @@
+"""
+Tests for batched embed + persist during ingestion (no database: repositories are faked).
+"""
+import threading
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from bharatrag.domain.document import Document
+from bharatrag.domain.ingestion_job import IngestionJob, IngestionJobCreate
+from bharatrag.services import ingestion_service
+from bharatrag.services.ingestion_service import IngestionService, _ProgressThrottle
+
+
+class _RecordingJobRepo:
+    def __init__(self):
+        self.progress = []
+
+    def update_progress(self, job_id, progress):
+        self.progress.append(progress)
+
+
+class _PagesHandler:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def extract_text(self, uri):
+        return self.pages
+
+    def supports(self, format, source_type):
+        return True
+
+
+class _RecordingChunkRepo:
+    def __init__(self):
+        self.batches = []
+
+    def bulk_create(self, rows, *, session=None):
+        self.batches.append(rows)
+        return len(rows)
+
+
+def test_embed_and_persist_in_batches(monkeypatch):
+    monkeypatch.setattr(
+        ingestion_service, "settings", ingestion_service.settings.model_copy(update={"ingest_batch_size": 2})
+    )
+    chunk_repo = _RecordingChunkRepo()
+    svc = IngestionService(chunk_repo=chunk_repo, handlers=[])
+    document = Document.model_construct(
+        id=uuid.uuid4(),
+        collection_id=uuid.uuid4(),
+        created_at=datetime.now(timezone.utc),
+    )
+    items = [(i, f"chunk {i}", {"page_number": i}) for i in range(5)]
+
+    assert svc._embed_and_persist(document, items) == 5
+
+    assert [len(b) for b in chunk_repo.batches] == [2, 2, 1]
+    rows = [r for b in chunk_repo.batches for r in b]
+    assert [r.chunk_index for r in rows] == [0, 1, 2, 3, 4]
+    assert rows[3].extra_metadata == {"page_number": 3}
+    assert rows[0].embedding.shape == (svc.embedder.dim,)
+
+
+def test_progress_throttle_coalesces_updates(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(ingestion_service.time, "monotonic", lambda: now[0])
+    writes = []
+    progress = _ProgressThrottle(writes.append, interval=0.5, every=3)
+
+    progress.set({"page": 1})
+    progress.set({"page": 2})
+    assert writes == []
+
+    progress.set({"page": 3})  # every=3 reached
+    assert writes == [{"page": 3}]
+
+    now[0] = 1.0
+    progress.set({"page": 4})  # interval elapsed
+    progress.set({"page": 5})
+    progress.flush()
+    progress.flush()  # nothing pending
+
+    assert writes == [{"page": 3}, {"page": 4}, {"page": 5}]
+
+
+def test_handler_pages_are_chunked_and_persisted_in_batches(monkeypatch):
+    monkeypatch.setattr(
+        ingestion_service, "settings", ingestion_service.settings.model_copy(update={"ingest_batch_size": 2})
+    )
+    chunk_repo = _RecordingChunkRepo()
+    pages = [
+        ("first page", {"page_number": 1, "total_pages": 3}),
+        ("", {"page_number": 2, "total_pages": 3, "extraction_error": "boom"}),
+        ("x" * 1000, {"page_number": 3, "total_pages": 3}),
+    ]
+    handler = _PagesHandler(pages)
+    svc = IngestionService(repo=_RecordingJobRepo(), chunk_repo=chunk_repo, handlers=[handler])
+    document = Document.model_construct(
+        id=uuid.uuid4(),
+        collection_id=uuid.uuid4(),
+        created_at=datetime.now(timezone.utc),
+    )
+    payload = IngestionJobCreate.model_construct(
+        collection_id=document.collection_id, source_type="file", format="pdf", uri="doc.pdf"
+    )
+
+    result = svc._process_with_handler(pages, payload, document, uuid.uuid4())
+
+    assert [len(b) for b in chunk_repo.batches] == [2, 1]
+    rows = [r for b in chunk_repo.batches for r in b]
+    assert [r.chunk_index for r in rows] == [0, 1, 2]
+    assert [r.extra_metadata["page_number"] for r in rows] == [1, 3, 3]
+    assert [r.extra_metadata["chunk_index_in_page"] for r in rows] == [0, 0, 1]
+    assert result["status"] == "PARTIAL"
+    assert result["failed_pages"] == [2]
+    assert result["progress"]["successful_chunks"] == 3
+    assert svc.repo.progress[-1]["pages_processed"] == 3
+
+
+def test_load_text_resolves_files_and_raw_content(tmp_path):
+    svc = IngestionService(repo=_RecordingJobRepo(), chunk_repo=_RecordingChunkRepo())
+    doc = tmp_path / "doc.txt"
+    doc.write_text("hello from disk", encoding="utf-8")
+
+    assert "".join(svc._load_text(str(doc))) == "hello from disk"
+    assert "".join(svc._load_text(f"file://{doc}")) == "hello from disk"
+    # Directories and over-long "paths" are treated as raw content
+    assert list(svc._load_text(str(tmp_path))) == [str(tmp_path)]
+    raw = "word " * 200
+    assert list(svc._load_text(raw)) == [raw]
+
+
+def test_get_handler_remembers_matches():
+    class _CountingHandler(_PagesHandler):
+        calls = 0
+
+        def supports(self, format, source_type):
+            type(self).calls += 1
+            return format == "pdf"
+
+    handler = _CountingHandler([])
+    svc = IngestionService(repo=_RecordingJobRepo(), chunk_repo=_RecordingChunkRepo(), handlers=[handler])
+
+    assert svc._get_handler("pdf", "file") is handler
+    assert svc._get_handler("pdf", "file") is handler
+    assert _CountingHandler.calls == 1
+    assert svc._get_handler("docx", "file") is None
+
+
+class _FakeSession:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def begin(self):
+        session = self
+        self.log.append("begin")
+
+        class _Tx:
+            def __enter__(self):
+                return session
+
+            def __exit__(self, exc_type, *rest):
+                session.log.append("rollback" if exc_type else "commit")
+                return False
+
+        return _Tx()
+
+
+class _SessionDocumentRepo:
+    def __init__(self, collection_id):
+        self.collection_id = collection_id
+        self.sessions = []
+
+    def create(self, payload, *, session=None):
+        self.sessions.append(session)
+        return Document.model_construct(
+            id=uuid.uuid4(), collection_id=self.collection_id, created_at=datetime.now(timezone.utc)
+        )
+
+
+class _StatusJobRepo(_RecordingJobRepo):
+    def update_status(self, job_id, status, **kwargs):
+        return None
+
+
+def test_store_raw_writes_document_and_chunks_in_one_transaction():
+    log: list[str] = []
+    collection_id = uuid.uuid4()
+    chunk_sessions = []
+    fail_persist = False
+
+    class _ChunkRepo(_RecordingChunkRepo):
+        def bulk_create(self, rows, *, session=None):
+            if fail_persist:
+                raise RuntimeError("insert failed")
+            chunk_sessions.append(session)
+            return super().bulk_create(rows)
+
+    class _LoggingHandler(_PagesHandler):
+        def extract_text(self, uri):
+            log.append("extract")
+            return super().extract_text(uri)
+
+    handler = _LoggingHandler([("some text", {}), ("more text", {})])
+    document_repo = _SessionDocumentRepo(collection_id)
+    svc = IngestionService(
+        repo=_StatusJobRepo(),
+        document_repo=document_repo,
+        chunk_repo=_ChunkRepo(),
+        handlers=[handler],
+        session_factory=lambda: _FakeSession(log),
+    )
+    payload = IngestionJobCreate.model_construct(
+        collection_id=collection_id, source_type="file", format="pdf", uri="doc.pdf"
+    )
+
+    assert svc._store_raw(payload, uuid.uuid4())["status"] == "COMPLETED"
+    # Extraction finishes before the transaction opens
+    assert log == ["extract", "begin", "commit"]
+    session = document_repo.sessions[0]
+    assert isinstance(session, _FakeSession)
+    assert chunk_sessions and all(s is session for s in chunk_sessions)
+
+    log.clear()
+    fail_persist = True
+    with pytest.raises(RuntimeError):
+        svc._store_raw(payload, uuid.uuid4())
+    assert log == ["extract", "begin", "rollback"]
+
+
+def test_mark_failed_does_not_wait_for_a_stuck_database(monkeypatch):
+    release = threading.Event()
+
+    class _StuckJobRepo:
+        def update_status(self, job_id, status, **kwargs):
+            release.wait(5)
+
+    monkeypatch.setattr(ingestion_service, "_FAILED_STATUS_TIMEOUT", 0.05)
+    svc = IngestionService(repo=_StuckJobRepo(), chunk_repo=_RecordingChunkRepo())
+    job = IngestionJob.model_construct(
+        id=uuid.uuid4(), status="RUNNING", error_summary=None, completed_at=None
+    )
+
+    failed = svc._mark_failed(job, "db down")
+    release.set()
+
+    assert failed.status == "FAILED"
+    assert failed.error_summary == "db down"
+    assert failed.completed_at is not None
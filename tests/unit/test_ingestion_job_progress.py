@@ -0,0 +1,36 @@
+"""
+Tests for in-flight ingestion job progress updates.
+"""
+import os
+import uuid
+
+import pytest
+
+
+def _db_enabled() -> bool:
+    return os.getenv("BHARATRAG_RUN_DB_TESTS", "1") == "1"
+
+
+@pytest.mark.skipif(not _db_enabled(), reason="Database tests disabled")
+def test_update_progress_merges_within_a_stage_and_replaces_across_stages():
+    from bharatrag.domain.collection import CollectionCreate
+    from bharatrag.domain.ingestion_job import IngestionJobCreate
+    from bharatrag.services.repositories.collection_repository import (
+        CollectionRepository,
+    )
+    from bharatrag.services.repositories.ingestion_job_repository import (
+        IngestionJobRepository,
+    )
+
+    collection = CollectionRepository().create(CollectionCreate(name=f"progress-{uuid.uuid4()}"))
+    repo = IngestionJobRepository()
+    job = repo.create(
+        IngestionJobCreate(collection_id=collection.id, source_type="file", format="pdf")
+    )
+
+    repo.update_status(job.id, "RUNNING", progress={"stage": "document_created", "document_id": "d1"})
+    repo.update_progress(job.id, {"stage": "extracting", "current_page": 1, "total_pages": 3})
+    assert repo.get(job.id).progress == {"stage": "extracting", "current_page": 1, "total_pages": 3}
+
+    repo.update_progress(job.id, {"stage": "extracting", "current_page": 2})
+    assert repo.get(job.id).progress == {"stage": "extracting", "current_page": 2, "total_pages": 3}
@@ -0,0 +1,120 @@
+"""
+Tests for the llama.cpp LLM backend and the LLM factory, with a fake `Llama`.
+"""
+import pytest
+
+from bharatrag.core.config import Settings
+from bharatrag.services.llm import llama_cpp_llm
+from bharatrag.services.llm.extractive_llm import ExtractiveLLM
+from bharatrag.services.llm.llama_cpp_llm import LlamaCppLLM
+from bharatrag.services.llm.llm_factory import create_llm
+
+
+class _FakeLlama:
+    """One token per prompt byte; records every model load and completion."""
+
+    instances: list["_FakeLlama"] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.prompts: list = []
+        _FakeLlama.instances.append(self)
+
+    def tokenize(self, text: bytes) -> list[int]:
+        return list(text)
+
+    def create_completion(self, prompt, max_tokens, temperature, stream=False):
+        self.prompts.append(prompt)
+        if stream:
+            return iter([{"choices": [{"text": t}]} for t in ("Delhi", "", " is", " the capital")])
+        return {"choices": [{"text": "  New Delhi.  "}]}
+
+
+@pytest.fixture
+def fake_llama(monkeypatch, tmp_path):
+    _FakeLlama.instances = []
+    monkeypatch.setattr(llama_cpp_llm, "Llama", _FakeLlama)
+    model_path = tmp_path / "model-q4_k_m.gguf"
+    model_path.write_bytes(b"")
+    return model_path
+
+
+def test_generate_loads_model_once_and_strips_text(fake_llama):
+    llm = LlamaCppLLM(str(fake_llama), n_ctx=512, max_new_tokens=64, n_threads=2)
+
+    assert llm.generate("short prompt") == "New Delhi."
+    assert llm.generate("another") == "New Delhi."
+
+    assert len(_FakeLlama.instances) == 1
+    model = _FakeLlama.instances[0]
+    assert model.kwargs == {"model_path": str(fake_llama), "n_ctx": 512, "n_threads": 2, "verbose": False}
+    assert model.prompts == ["short prompt", "another"]
+
+
+def test_stream_yields_non_empty_chunks(fake_llama):
+    llm = LlamaCppLLM(str(fake_llama))
+
+    assert list(llm.stream("q")) == ["Delhi", " is", " the capital"]
+
+
+def test_long_prompt_is_truncated_to_leave_room_for_the_answer(fake_llama):
+    llm = LlamaCppLLM(str(fake_llama), n_ctx=300, max_new_tokens=100)
+    prompt = "QUESTION:\nq\n\nCONTEXT:\n" + "x" * 500
+
+    llm.generate(prompt)
+    list(llm.stream(prompt))
+
+    for sent in _FakeLlama.instances[0].prompts:
+        assert sent == list(prompt.encode("utf-8"))[:200]
+
+
+def test_max_new_tokens_must_fit_in_context():
+    with pytest.raises(ValueError, match="max_new_tokens"):
+        LlamaCppLLM("model.gguf", n_ctx=256, max_new_tokens=256)
+
+
+def test_model_directory_picks_the_configured_quantization(fake_llama):
+    (fake_llama.parent / "model-q8_0.gguf").write_bytes(b"")
+
+    llm = LlamaCppLLM(str(fake_llama.parent), quantization="q8_0")
+    llm.generate("q")
+
+    assert _FakeLlama.instances[0].kwargs["model_path"] == str(fake_llama.parent / "model-q8_0.gguf")
+
+
+def test_missing_llama_cpp_raises(monkeypatch, tmp_path):
+    monkeypatch.setattr(llama_cpp_llm, "Llama", None)
+
+    with pytest.raises(ValueError, match="llama-cpp-python"):
+        LlamaCppLLM(str(tmp_path / "model.gguf")).generate("q")
+
+
+def test_create_llm_builds_llama_cpp_backend(fake_llama):
+    settings = Settings(
+        llm_backend="llama_cpp",
+        llm_gguf_path=str(fake_llama),
+        llm_quantization="q8_0",
+        llm_context_size=1024,
+        llm_max_new_tokens=128,
+    )
+
+    llm = create_llm(settings)
+
+    assert isinstance(llm, LlamaCppLLM)
+    assert (llm.model_path, llm.quantization, llm.n_ctx, llm.max_new_tokens) == (
+        str(fake_llama),
+        "q8_0",
+        1024,
+        128,
+    )
+    # The model itself is only loaded on first use
+    assert _FakeLlama.instances == []
+
+
+def test_create_llm_requires_gguf_path_for_llama_cpp():
+    with pytest.raises(ValueError, match="llm_gguf_path"):
+        create_llm(Settings(llm_backend="llama_cpp", llm_gguf_path=None))
+
+
+def test_create_llm_defaults_to_extractive():
+    assert isinstance(create_llm(Settings(llm_backend="extractive")), ExtractiveLLM)
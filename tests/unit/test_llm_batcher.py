@@ -0,0 +1,121 @@
+"""
+Tests for the LLM micro-batcher.
+"""
+import asyncio
+import time
+
+import pytest
+
+from bharatrag.services.llm.batcher import LLMBatcher
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def generate(self, prompt: str) -> str:
+        return self.generate_batch([prompt])[0]
+
+    def generate_batch(self, prompts: list[str]) -> list[str]:
+        self.batches.append(list(prompts))
+        return [p.upper() for p in prompts]
+
+
+class _FailingLLM(_RecordingLLM):
+    def generate_batch(self, prompts: list[str]) -> list[str]:
+        raise RuntimeError("boom")
+
+
+def test_batcher_coalesces_concurrent_prompts():
+    llm = _RecordingLLM()
+    batcher = LLMBatcher(llm, max_batch_size=8)
+
+    async def run():
+        outs = await asyncio.gather(*(batcher.submit(f"q{i}") for i in range(5)))
+        await batcher.close()
+        return outs
+
+    outs = asyncio.run(run())
+
+    assert outs == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+    assert llm.batches == [["q0", "q1", "q2", "q3", "q4"]]
+
+
+def test_batcher_respects_max_batch_size():
+    llm = _RecordingLLM()
+    batcher = LLMBatcher(llm, max_batch_size=2)
+
+    async def run():
+        outs = await asyncio.gather(*(batcher.submit(f"q{i}") for i in range(5)))
+        await batcher.close()
+        return outs
+
+    assert asyncio.run(run()) == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+    assert [len(b) for b in llm.batches] == [2, 2, 1]
+
+
+def test_batcher_propagates_errors_to_every_caller():
+    batcher = LLMBatcher(_FailingLLM())
+
+    async def run():
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batcher_survives_event_loop_change():
+    llm = _RecordingLLM()
+    batcher = LLMBatcher(llm)
+
+    assert asyncio.run(batcher.submit("first")) == "FIRST"
+    assert asyncio.run(batcher.submit("second")) == "SECOND"
+
+
+def test_batcher_rejects_invalid_batch_size():
+    with pytest.raises(ValueError):
+        LLMBatcher(_RecordingLLM(), max_batch_size=0)
+
+
+def test_batcher_fails_callers_left_without_a_result():
+    class _ShortLLM(_RecordingLLM):
+        def generate_batch(self, prompts):
+            return ["only one"]
+
+    batcher = LLMBatcher(_ShortLLM())
+
+    async def run():
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batcher_runs_batches_side_by_side():
+    class _SlowLLM(_RecordingLLM):
+        def generate_batch(self, prompts):
+            time.sleep(0.2)
+            return super().generate_batch(prompts)
+
+    llm = _SlowLLM()
+    batcher = LLMBatcher(llm, max_batch_size=1, max_concurrency=3)
+
+    async def run():
+        start = time.perf_counter()
+        outs = await asyncio.gather(*(batcher.submit(f"q{i}") for i in range(3)))
+        elapsed = time.perf_counter() - start
+        await batcher.close()
+        return outs, elapsed
+
+    outs, elapsed = asyncio.run(run())
+    assert outs == ["Q0", "Q1", "Q2"]
+    # Serialized, three generations would take 0.6s
+    assert elapsed < 0.45
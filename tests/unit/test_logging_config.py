@@ -0,0 +1,50 @@
+"""
+Tests for the buffered log backend.
+"""
+import io
+import json
+import logging
+
+from bharatrag.core.logging_config import (
+    BharatJsonFormatter,
+    BufferedStreamHandler,
+    ContextFilter,
+)
+
+
+def _logger(stream: io.StringIO) -> tuple[logging.Logger, BufferedStreamHandler]:
+    handler = BufferedStreamHandler(stream, flush_interval=60)
+    handler.setFormatter(BharatJsonFormatter(fmt="%(message)s %(request_id)s"))
+    handler.addFilter(ContextFilter())
+    logger = logging.getLogger(f"test-buffered-{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_buffered_handler_writes_batch_on_flush():
+    stream = io.StringIO()
+    logger, handler = _logger(stream)
+
+    items = ["a"]
+    logger.info("items=%s", items, extra={"n": 1})
+    items.append("b")  # mutation after the call must not leak into the record
+    logger.info("second")
+    assert stream.getvalue() == ""
+
+    handler.flush()
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["items=['a']", "second"]
+    assert lines[0]["n"] == 1
+    assert lines[0]["request_id"] == "-"
+    handler.close()
+
+
+def test_buffered_handler_close_drains_buffer():
+    stream = io.StringIO()
+    logger, handler = _logger(stream)
+    logger.info("pending")
+
+    handler.close()
+    assert json.loads(stream.getvalue())["message"] == "pending"
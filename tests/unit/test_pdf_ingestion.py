@@ -193,3 +193,102 @@ def test_pdf_handler_text_cleaning():
     assert "\n\n\n" not in cleaned  # No triple newlines
     assert len(cleaned.split("\n")) <= len(dirty_text.split("\n"))  # Fewer or equal lines
 
+
+
+def test_pdf_handler_parallel_extraction_matches_serial(monkeypatch):
+    """Large PDFs split across worker processes keep page order and metadata."""
+    from bharatrag.services.ingestion_handlers import pdf_handler
+
+    # Exercise the pypdf path even when pypdfium2 is installed
+    monkeypatch.setattr(pdf_handler, "pdfium", None)
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        pdf_path = Path(f.name)
+    try:
+        _create_test_pdf(20, pdf_path)
+
+        serial = PdfIngestionHandler(workers=1).extract_text(str(pdf_path))
+        parallel = PdfIngestionHandler(workers=3, parallel_min_pages=4).extract_text(str(pdf_path))
+
+        assert parallel == serial
+        assert [m["page_number"] for _, m in parallel] == list(range(1, 21))
+    finally:
+        pdf_path.unlink(missing_ok=True)
+
+
+def test_pdf_handler_pdfium_extraction_is_serialized():
+    """pypdfium2 extraction from concurrent jobs never overlaps inside PDFium."""
+    pytest.importorskip("pypdfium2")
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bharatrag.services.ingestion_handlers import pdf_handler
+
+    inside = 0
+    overlapped = threading.Event()
+    page_text = PdfIngestionHandler._pdfium_page_text
+
+    def tracking_page_text(pdf, page_num):
+        nonlocal inside
+        inside += 1
+        if inside > 1:
+            overlapped.set()
+        try:
+            return page_text(pdf, page_num)
+        finally:
+            inside -= 1
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        pdf_path = Path(f.name)
+    try:
+        _create_test_pdf(8, pdf_path)
+        handler = PdfIngestionHandler()
+        handler._pdfium_page_text = tracking_page_text
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(handler.extract_text, [str(pdf_path)] * 8))
+
+        assert not overlapped.is_set()
+        assert pdf_handler._pdfium_lock.acquire(blocking=False)
+        pdf_handler._pdfium_lock.release()
+        for pages in results:
+            assert [m["page_number"] for _, m in pages] == list(range(1, 9))
+            assert all(m["extraction_method"] == "pypdfium2" for _, m in pages)
+    finally:
+        pdf_path.unlink(missing_ok=True)
+
+
+def test_pdf_handler_recovers_from_broken_pool(monkeypatch):
+    """A dead worker process falls back to serial extraction and resets the pool."""
+    from concurrent.futures.process import BrokenProcessPool
+
+    from bharatrag.services.ingestion_handlers import pdf_handler
+
+    monkeypatch.setattr(pdf_handler, "pdfium", None)
+
+    class _BrokenPool:
+        shut_down = False
+
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            self.shut_down = True
+
+    broken = _BrokenPool()
+    monkeypatch.setattr(pdf_handler, "_pool", broken)
+    monkeypatch.setattr(pdf_handler, "_pool_workers", 3)
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        pdf_path = Path(f.name)
+    try:
+        _create_test_pdf(6, pdf_path)
+
+        pages = PdfIngestionHandler(workers=3, parallel_min_pages=4).extract_text(str(pdf_path))
+
+        assert [m["page_number"] for _, m in pages] == list(range(1, 7))
+        assert all("extraction_error" not in m for _, m in pages)
+        assert broken.shut_down
+        assert pdf_handler._pool is None
+    finally:
+        pdf_path.unlink(missing_ok=True)
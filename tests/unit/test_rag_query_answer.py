@@ -68,7 +68,7 @@ def test_weekend3_rag_flow_query_and_answer():
         assert isinstance(result["score"], (int, float)), "Score should be numeric"
 
     # 4) Answer - verify RAG with citations
-    r = client.post("/answer", json={"collection_id": collection_id, "question": "Explain Bharat-RAG", "top_k": 3})
+    r = client.post("/answer/sync", json={"collection_id": collection_id, "question": "Explain Bharat-RAG", "top_k": 3})
     assert r.status_code == 200, r.text
     ans = r.json()
     assert "answer" in ans
@@ -93,3 +93,9 @@ def test_weekend3_rag_flow_query_and_answer():
     answer_chunk_ids = {citation["chunk_id"] for citation in ans["citations"]}
     # At least some citations should match query results (they may not all match due to ordering)
     assert len(query_chunk_ids & answer_chunk_ids) > 0, "Citations should reference chunks from query"
+
+    # 5) Streaming answer - tokens as SSE, citations in the trailing done event
+    r = client.post("/answer", json={"collection_id": collection_id, "question": "Explain Bharat-RAG", "top_k": 3})
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("text/event-stream")
+    assert "event: done" in r.text
@@ -0,0 +1,47 @@
+"""
+Tests for the API response classes.
+"""
+import json
+import uuid
+from datetime import datetime, timezone
+
+from bharatrag.api.responses import ModelJSONResponse
+from bharatrag.domain.chunk import ChunkSearchResult
+from bharatrag.domain.collection import Collection
+from bharatrag.domain.query import QueryResponse
+
+
+def test_model_json_response_matches_fastapi_serialization():
+    row = {
+        "id": uuid.uuid4(),
+        "document_id": uuid.uuid4(),
+        "collection_id": uuid.uuid4(),
+        "chunk_index": 0,
+        "text": "ಕನ್ನಡ text \"quoted\"",
+        "metadata": {"page": 1},
+        "created_at": datetime.now(timezone.utc),
+        "score": 0.5,
+    }
+    response = QueryResponse.model_construct(
+        results=[ChunkSearchResult.from_search_row(row)], debug={"top_k": 1}
+    )
+
+    r = ModelJSONResponse(response)
+
+    assert r.media_type == "application/json"
+    body = json.loads(r.body)
+    assert body == response.model_dump(mode="json", by_alias=True)
+    assert body["results"][0]["chunk"]["extra_metadata"] == {"page": 1}
+
+
+def test_model_json_response_encodes_model_lists():
+    now = datetime.now(timezone.utc)
+    collections = [
+        Collection.model_construct(id=uuid.uuid4(), name=f"c{i}", created_at=now, updated_at=now)
+        for i in range(3)
+    ]
+
+    body = json.loads(ModelJSONResponse(collections).body)
+
+    assert [c["name"] for c in body] == ["c0", "c1", "c2"]
+    assert json.loads(ModelJSONResponse([]).body) == []
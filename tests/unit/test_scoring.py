@@ -0,0 +1,33 @@
+"""
+Tests for the cosine top-k scoring kernel.
+"""
+import numpy as np
+
+from bharatrag.services.scoring import cosine_topk
+
+
+def _unit_rows(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    m = np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+    return m / np.linalg.norm(m, axis=1, keepdims=True)
+
+
+def test_cosine_topk_matches_full_sort():
+    m = _unit_rows(1000, 384)
+    q = m[42]
+
+    idx, scores = cosine_topk(q, m, 10)
+
+    expected = np.argsort(-(m @ q))[:10]
+    assert idx.tolist() == expected.tolist()
+    assert idx[0] == 42
+    assert np.all(np.diff(scores) <= 0)
+
+
+def test_cosine_topk_with_k_at_least_n():
+    m = _unit_rows(3, 8)
+
+    idx, scores = cosine_topk(m[1], m, 5)
+
+    assert sorted(idx.tolist()) == [0, 1, 2]
+    assert idx[0] == 1
+    assert len(scores) == 3
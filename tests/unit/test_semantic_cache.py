@@ -0,0 +1,103 @@
+"""
+Tests for the LSH-based semantic answer cache.
+"""
+import numpy as np
+import pytest
+
+from bharatrag.services.semantic_cache import SemanticCache
+
+
+def _vec(seed: int, dim: int = 384) -> list[float]:
+    return np.random.default_rng(seed).standard_normal(dim).tolist()
+
+
+def test_semantic_cache_hit_on_same_vector():
+    cache = SemanticCache(dim=384)
+    v = _vec(1)
+
+    assert cache.get("c1", v) is None
+    cache.set("c1", v, "answer")
+    assert cache.get("c1", v) == "answer"
+
+
+def test_semantic_cache_hit_on_near_duplicate_vector():
+    cache = SemanticCache(dim=384, nbits=8, threshold=0.95)
+    v = np.asarray(_vec(1))
+    near = (v * 2.0).tolist()  # same direction, different magnitude
+
+    cache.set("c1", v.tolist(), "answer")
+    assert cache.get("c1", near) == "answer"
+
+
+def test_semantic_cache_miss_on_different_vector_or_namespace():
+    cache = SemanticCache(dim=384)
+    v = _vec(1)
+    cache.set(("c1", 5), v, "answer")
+
+    assert cache.get(("c1", 5), _vec(2)) is None
+    assert cache.get(("c2", 5), v) is None
+    assert cache.get(("c1", 3), v) is None
+
+
+def test_semantic_cache_invalidate_by_collection():
+    cache = SemanticCache(dim=384)
+    v = _vec(1)
+    cache.set(("c1", 5), v, "a")
+    cache.set(("c2", 5), v, "b")
+
+    cache.invalidate("c1")
+
+    assert cache.get(("c1", 5), v) is None
+    assert cache.get(("c2", 5), v) == "b"
+    assert len(cache) == 1
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    cache = SemanticCache(dim=384, max_entries=2)
+    v1, v2, v3 = _vec(1), _vec(2), _vec(3)
+    cache.set("c", v1, 1)
+    cache.set("c", v2, 2)
+    cache.get("c", v1)  # v1 becomes most recent
+    cache.set("c", v3, 3)
+
+    assert cache.get("c", v1) == 1
+    assert cache.get("c", v2) is None
+    assert cache.get("c", v3) == 3
+
+
+def test_semantic_cache_expires_entries(monkeypatch):
+    cache = SemanticCache(dim=384, ttl_seconds=10.0)
+    v = _vec(1)
+    now = [1000.0]
+    monkeypatch.setattr("bharatrag.services.semantic_cache.time.monotonic", lambda: now[0])
+
+    cache.set("c", v, "answer")
+    now[0] += 11.0
+
+    assert cache.get("c", v) is None
+    assert len(cache) == 0
+
+
+def test_semantic_cache_rejects_wrong_dimension():
+    cache = SemanticCache(dim=384)
+    with pytest.raises(ValueError, match="dim"):
+        cache.get("c", [0.1, 0.2])
+
+
+def test_semantic_cache_drops_write_computed_before_invalidate():
+    cache = SemanticCache(dim=384)
+    v = _vec(1)
+    # An answer request reads the generation, then retrieves...
+    stale = cache.generation(("c1", 5))
+    other = cache.generation(("c2", 5))
+    # ...while an ingest into c1 commits and invalidates
+    cache.invalidate("c1")
+
+    cache.set(("c1", 5), v, "pre-ingest answer", generation=stale)
+    cache.set(("c2", 5), v, "b", generation=other)
+
+    assert cache.get(("c1", 5), v) is None
+    assert cache.get(("c2", 5), v) == "b"
+
+    cache.set(("c1", 5), v, "fresh", generation=cache.generation(("c1", 5)))
+    assert cache.get(("c1", 5), v) == "fresh"
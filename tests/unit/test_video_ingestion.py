@@ -7,10 +7,12 @@ import uuid
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from bharatrag.main import app
+from bharatrag.services.ingestion_handlers import video_handler
 from bharatrag.services.ingestion_handlers.video_handler import VideoIngestionHandler
 
 
@@ -86,16 +88,16 @@ def test_video_ingestion_end_to_end():
         pytest.skip("Video processing dependencies not installed")
 
     # For testing, we'll mock the video processing since creating real videos is complex
-    with patch("bharatrag.services.ingestion_handlers.video_handler.VideoFileClip") as mock_video:
-        # Mock video with audio
-        mock_audio = Mock()
-        mock_audio.duration = 10.0
-        mock_video_instance = Mock()
-        mock_video_instance.audio = mock_audio
-        mock_video_instance.duration = 10.0
-        mock_video.return_value = mock_video_instance
-
-        with patch("bharatrag.services.ingestion_handlers.video_handler.whisper.load_model") as mock_whisper:
+    with patch(
+        "bharatrag.services.ingestion_handlers.video_handler._probe",
+        return_value=(10.0, True),
+    ):
+        with patch("bharatrag.services.ingestion_handlers.video_handler.WhisperModel", None), \
+                patch(
+                    "bharatrag.services.ingestion_handlers.video_handler._decode_audio",
+                    return_value=np.zeros(16_000, dtype=np.float32),
+                ), \
+                patch("bharatrag.services.ingestion_handlers.video_handler.whisper.load_model") as mock_whisper:
             mock_model = Mock()
             mock_model.transcribe.return_value = {
                 "text": "This is a test transcription.",
@@ -109,6 +111,7 @@ def test_video_ingestion_end_to_end():
                 ],
             }
             mock_whisper.return_value = mock_model
+            video_handler._load_whisper.cache_clear()
 
             client = TestClient(app)
 
@@ -179,12 +182,11 @@ def test_video_no_audio():
 
     handler = VideoIngestionHandler()
 
-    with patch("bharatrag.services.ingestion_handlers.video_handler.VideoFileClip") as mock_video:
-        # Mock video without audio
-        mock_video_instance = Mock()
-        mock_video_instance.audio = None
-        mock_video.return_value = mock_video_instance
-
+    # Mock video without audio
+    with patch(
+        "bharatrag.services.ingestion_handlers.video_handler._probe",
+        return_value=(10.0, False),
+    ):
         with tempfile.NamedTemporaryFile(mode="wb", suffix=".mp4", delete=False) as f:
             video_path = f.name
 
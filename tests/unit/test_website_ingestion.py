@@ -1,7 +1,10 @@
 """
 Tests for website ingestion handler.
 """
+import asyncio
 import os
+import threading
+import time
 import uuid
 from unittest.mock import Mock, patch
 
@@ -56,10 +59,11 @@ def test_website_ingestion_end_to_end():
         pytest.skip("Website extraction dependencies not installed")
 
     # Mock the website fetching to avoid external dependencies in tests
-    with patch("bharatrag.services.ingestion_handlers.website_handler.requests.get") as mock_get:
+    with patch("bharatrag.services.ingestion_handlers.website_handler._get_session") as mock_session:
+        mock_get = mock_session.return_value.get
         # Mock successful HTTP response
         mock_response = Mock()
-        mock_response.text = """
+        html = """
         <html>
         <head><title>Test Article</title></head>
         <body>
@@ -71,66 +75,66 @@ def test_website_ingestion_end_to_end():
         </body>
         </html>
         """
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [html.encode()]
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
-        with patch("bharatrag.services.ingestion_handlers.website_handler.extract") as mock_extract:
-            mock_extract.return_value = "Test Article Title\n\nThis is a test article with some content for ingestion.\n\nIt has multiple paragraphs to test extraction."
-
-            # Patch trafilatura.extract_metadata (imported inside the method)
-            with patch("trafilatura.extract_metadata") as mock_meta:
-                from trafilatura.core import Document
-                mock_meta.return_value = Document(
-                    url="https://example.com/test",
-                    title="Test Article Title",
-                    author="Test Author",
-                )
-
-                client = TestClient(app)
-
-                # 1) Create collection
-                cname = f"website-test-{uuid.uuid4()}"
-                r = client.post("/collections", json={"name": cname})
-                assert r.status_code == 201
-                collection_id = r.json()["id"]
-
-                # 2) Ingest website
+        with patch("bharatrag.services.ingestion_handlers.website_handler.bare_extraction") as mock_extract:
+            from trafilatura.core import Document
+            mock_extract.return_value = Document(
+                text="Test Article Title\n\nThis is a test article with some content for ingestion.\n\nIt has multiple paragraphs to test extraction.",
+                url="https://example.com/test",
+                title="Test Article Title",
+                author="Test Author",
+            )
+
+            client = TestClient(app)
+
+            # 1) Create collection
+            cname = f"website-test-{uuid.uuid4()}"
+            r = client.post("/collections", json={"name": cname})
+            assert r.status_code == 201
+            collection_id = r.json()["id"]
+
+            # 2) Ingest website
+            r = client.post(
+                "/ingestion-jobs",
+                json={
+                    "collection_id": collection_id,
+                    "source_type": "url",
+                    "format": "html",
+                    "uri": "https://example.com/test",
+                },
+            )
+            assert r.status_code == 201
+            job = r.json()
+
+            # Job should complete
+            assert job["status"] in ("COMPLETED", "PARTIAL")
+            assert job["progress"]["stage"] == "persisted"
+
+            # 3) Query should work
+            if job["status"] in ("COMPLETED", "PARTIAL"):
                 r = client.post(
-                    "/ingestion-jobs",
+                    "/query",
                     json={
                         "collection_id": collection_id,
-                        "source_type": "url",
-                        "format": "html",
-                        "uri": "https://example.com/test",
+                        "query": "test article",
+                        "top_k": 5,
                     },
                 )
-                assert r.status_code == 201
-                job = r.json()
-
-                # Job should complete
-                assert job["status"] in ("COMPLETED", "PARTIAL")
-                assert job["progress"]["stage"] == "persisted"
-
-                # 3) Query should work
-                if job["status"] in ("COMPLETED", "PARTIAL"):
-                    r = client.post(
-                        "/query",
-                        json={
-                            "collection_id": collection_id,
-                            "query": "test article",
-                            "top_k": 5,
-                        },
-                    )
-                    assert r.status_code == 200
-                    data = r.json()
-                    assert "results" in data
-
-                    # Check if chunks have website metadata
-                    for result in data.get("results", []):
-                        chunk = result.get("chunk", {})
-                        metadata = chunk.get("extra_metadata", {})
-                        if metadata:  # Only check if metadata exists
-                            assert "source" in metadata or "extraction_method" in metadata
+                assert r.status_code == 200
+                data = r.json()
+                assert "results" in data
+
+                # Check if chunks have website metadata
+                for result in data.get("results", []):
+                    chunk = result.get("chunk", {})
+                    metadata = chunk.get("extra_metadata", {})
+                    if metadata:  # Only check if metadata exists
+                        assert "source" in metadata or "extraction_method" in metadata
 
 
 def test_website_handler_url_validation():
@@ -147,3 +151,47 @@ def test_website_handler_url_validation():
     with pytest.raises(ValueError):
         handler.extract_text("file:///tmp/test.html")
 
+
+
+def test_website_handler_extract_many_runs_concurrently():
+    """extract_many overlaps page fetches and keeps input order."""
+    handler = WebsiteIngestionHandler()
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fake_extract(uri, *, fetched_at=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return [(uri, {"source": "website", "fetched_at": fetched_at})]
+
+    uris = [f"https://example.com/{i}" for i in range(6)]
+    with patch.object(handler, "extract_text", side_effect=fake_extract):
+        results = asyncio.run(handler.extract_many(uris, concurrency=3))
+
+    assert [r[0][0] for r in results] == uris
+    assert peak == 3
+    # One timestamp for the whole batch
+    assert len({r[0][1]["fetched_at"] for r in results}) == 1
+    assert results[0][0][1]["fetched_at"] is not None
+
+
+def test_website_handler_rejects_oversized_body():
+    """Bodies over max_bytes are rejected while streaming, whatever the headers say."""
+    handler = WebsiteIngestionHandler(max_bytes=100)
+    response = Mock()
+    response.headers = {"Content-Type": "text/html"}
+    response.iter_content.return_value = [b"x" * 60, b"x" * 60]
+
+    with patch(
+        "bharatrag.services.ingestion_handlers.website_handler._get_session"
+    ) as mock_session:
+        mock_session.return_value.get.return_value = response
+        with pytest.raises(ValueError, match="too large"):
+            handler.extract_text("https://example.com/big")
+
+    response.close.assert_called_once()